@@ -8,34 +8,66 @@ Generated on 2025-08-15.
 
 from __future__ import annotations
 
+import asyncio
+import json
+from typing import Any, AsyncIterator
 
 from fastapi import Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import ValidationError
+from starlette.types import Receive, Scope, Send
 
-from api.controllers.eval_schema import EvalRequest
+from api.controllers.eval_schema import EvalBatchRequest, EvalRequest
+from app.common.utils.executor import BoundedExecutor, PoolSaturatedError
+from app.common.utils.ndjson import aiter_lines, dumps_line
+from app.constants.values import (
+    EVAL_BATCH_MAX_ITEMS,
+    EVAL_RETRY_AFTER_SEC,
+    EVAL_STREAM_MAX_IN_FLIGHT,
+    EVAL_STREAM_MAX_LINE_BYTES,
+)
 from app.enums.api import HTTPStatusCode, ResponseKey
 from app.services.eval_service import EvalService
 
 
+class DuplexStreamingResponse(StreamingResponse):
+    """Streaming response whose body iterator still reads the request body.
+
+    `StreamingResponse` on ASGI servers older than spec 2.4 listens on
+    `receive` for a disconnect while streaming, which would swallow request
+    body chunks. Here the iterator itself consumes `receive` and sees the
+    disconnect as `ClientDisconnect`.
+    """
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """Stream the body without a competing disconnect listener."""
+        await self.stream_response(send)
+        if self.background is not None:
+            await self.background()
+
+
 class EvalController:
     """Summary of `EvalController`.
 
     Attributes:
         service: Description of `service`.
+        executor: Pool that runs the blocking evaluation off the event loop.
     """
 
-    def __init__(self, service: EvalService):
+    def __init__(self, service: EvalService, executor: BoundedExecutor):
         """Summary of `__init__`.
 
         Args:
             self: Description of self.
             service (ChatService): Description of service.
+            executor (BoundedExecutor): Pool that runs `service` calls.
 
         Returns:
             Any: Description of return value.
 
         """
         self.service = service
+        self.executor = executor
 
     async def run(self, request: Request):
         """Summary of `chat`.
@@ -51,7 +83,8 @@ class EvalController:
         try:
             body = EvalRequest(**await request.json())
 
-            result = self.service.run(
+            result = await self.executor.run(
+                self.service.run,
                 filtered_input=body.filtered_input,
                 response=body.response,
                 retrieved_docs=body.retrieved_docs,
@@ -61,9 +94,68 @@ class EvalController:
                 rendered_prompt=body.rendered_prompt,
                 raw_input=body.raw_input,
                 conversation_history=body.conversation_history,
+                sentence_scores=body.sentence_scores,
             )
             return JSONResponse(result, status_code=HTTPStatusCode.OK)
 
+        except PoolSaturatedError:
+            return saturated_response()
+        except ValueError as ve:
+            return JSONResponse(
+                {ResponseKey.ERROR: str(ve)}, status_code=HTTPStatusCode.BAD_REQUEST
+            )
+        except Exception:
+            return JSONResponse(
+                {ResponseKey.ERROR: "Internal server error"},
+                status_code=HTTPStatusCode.INTERNAL_SERVER_ERROR,
+            )
+
+    async def run_batch(self, request: Request):
+        """Evaluate a list of requests, returning per-item results in order.
+
+        Items that fail validation or scoring are reported individually
+        without affecting the rest of the batch.
+
+        Args:
+            self: Description of self.
+            request (Request): Description of request.
+
+        Returns:
+            Any: Description of return value.
+
+        """
+        try:
+            body = EvalBatchRequest(**await request.json())
+            if len(body.items) > EVAL_BATCH_MAX_ITEMS:
+                raise ValueError(
+                    f"Batch exceeds {EVAL_BATCH_MAX_ITEMS} items: {len(body.items)}"
+                )
+
+            entries: list[dict] = []
+            valid: list[tuple[int, dict]] = []
+            for index, item in enumerate(body.items):
+                try:
+                    valid.append((index, EvalRequest(**item).model_dump()))
+                    entries.append({ResponseKey.INDEX: index})
+                except ValidationError as ve:
+                    entries.append(
+                        {ResponseKey.INDEX: index, ResponseKey.ERROR: str(ve)}
+                    )
+
+            results = await self.executor.run(
+                self.service.run_batch, [item for _, item in valid]
+            )
+            for (index, _), result in zip(valid, results):
+                if ResponseKey.ERROR in result:
+                    entries[index][ResponseKey.ERROR] = result[ResponseKey.ERROR]
+                else:
+                    entries[index][ResponseKey.RESULT] = result
+            return JSONResponse(
+                {ResponseKey.RESULTS: entries}, status_code=HTTPStatusCode.OK
+            )
+
+        except PoolSaturatedError:
+            return saturated_response()
         except ValueError as ve:
             return JSONResponse(
                 {ResponseKey.ERROR: str(ve)}, status_code=HTTPStatusCode.BAD_REQUEST
@@ -73,3 +165,97 @@ class EvalController:
                 {ResponseKey.ERROR: "Internal server error"},
                 status_code=HTTPStatusCode.INTERNAL_SERVER_ERROR,
             )
+
+    async def run_stream(self, request: Request) -> DuplexStreamingResponse:
+        """Evaluate an NDJSON body of `EvalRequest` records as a stream.
+
+        Results are written as NDJSON in completion order, each tagged with
+        its `response_id` and input `line`. At most
+        `EVAL_STREAM_MAX_IN_FLIGHT` records are parsed or being scored at a
+        time; reading the body pauses until one finishes, so memory stays
+        bounded for inputs of any length.
+
+        Args:
+            self: Description of self.
+            request (Request): Request with a chunked NDJSON body.
+
+        Returns:
+            DuplexStreamingResponse: `application/x-ndjson` stream of results.
+        """
+        return DuplexStreamingResponse(
+            self._stream(request), media_type="application/x-ndjson"
+        )
+
+    async def _stream(self, request: Request) -> AsyncIterator[bytes]:
+        slots = asyncio.Semaphore(EVAL_STREAM_MAX_IN_FLIGHT)
+        results: asyncio.Queue[dict | None] = asyncio.Queue(EVAL_STREAM_MAX_IN_FLIGHT)
+        tasks: set[asyncio.Task] = set()
+
+        async def evaluate(line_no: int, line: bytes) -> None:
+            try:
+                await results.put(await self._evaluate_line(line_no, line))
+            finally:
+                slots.release()
+
+        async def produce() -> None:
+            line_no = 0
+            try:
+                async for line in aiter_lines(
+                    request.stream(), EVAL_STREAM_MAX_LINE_BYTES
+                ):
+                    await slots.acquire()
+                    task = asyncio.create_task(evaluate(line_no, line))
+                    tasks.add(task)
+                    task.add_done_callback(tasks.discard)
+                    line_no += 1
+            except Exception as exc:
+                await results.put(
+                    {ResponseKey.LINE: line_no, ResponseKey.ERROR: str(exc)}
+                )
+            for _ in range(EVAL_STREAM_MAX_IN_FLIGHT):
+                await slots.acquire()
+            await results.put(None)
+
+        producer = asyncio.create_task(produce())
+        try:
+            while (record := await results.get()) is not None:
+                yield dumps_line(record)
+        finally:
+            producer.cancel()
+            for task in list(tasks):
+                task.cancel()
+
+    async def _evaluate_line(self, line_no: int, line: bytes) -> dict[str, Any]:
+        entry: dict[str, Any] = {ResponseKey.LINE: line_no}
+        try:
+            body = EvalRequest(**json.loads(line))
+            entry[ResponseKey.RESPONSE_ID] = body.response_id
+            # A stream already limits its own concurrency, so wait for pool
+            # capacity instead of failing records with 503s.
+            result = await self.executor.run_when_free(
+                self.service.run, **body.model_dump()
+            )
+        except ValueError as ve:
+            entry[ResponseKey.ERROR] = str(ve)
+            return entry
+        except Exception:
+            entry[ResponseKey.ERROR] = "Internal server error"
+            return entry
+        if ResponseKey.ERROR in result:
+            entry[ResponseKey.ERROR] = result[ResponseKey.ERROR]
+        else:
+            entry[ResponseKey.RESULT] = result
+        return entry
+
+
+def saturated_response() -> JSONResponse:
+    """503 response telling the client when to retry a rejected eval.
+
+    Returns:
+        JSONResponse: Service-unavailable response with `Retry-After`.
+    """
+    return JSONResponse(
+        {ResponseKey.ERROR: "Evaluation capacity exhausted, retry later"},
+        status_code=HTTPStatusCode.SERVICE_UNAVAILABLE,
+        headers={"Retry-After": str(EVAL_RETRY_AFTER_SEC)},
+    )
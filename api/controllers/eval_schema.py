@@ -29,3 +29,15 @@ class EvalRequest(BaseModel):
     conversation_history: Optional[List[str]] = Field(
         default=None, description="Optional conversation history for the session."
     )
+    sentence_scores: bool = Field(
+        default=False,
+        description="Also return how well each response sentence is supported.",
+    )
+
+
+class EvalBatchRequest(BaseModel):
+    """Summary of `EvalBatchRequest`."""
+
+    items: List[Dict[str, Any]] = Field(
+        ..., description="Evaluation requests, each shaped like `EvalRequest`."
+    )
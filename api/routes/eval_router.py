@@ -6,25 +6,35 @@ Docstrings follow the Google Python style guide for consistency and clarity.
 Generated on 2025-08-15.
 """
 
+import os
+
 from fastapi import APIRouter, Depends, Request
 
 from api.controllers.eval_controller import EvalController
-from app.services.eval_service import EvalService
+from app.services.eval_service import EvalService, get_eval_executor
 
 router = APIRouter(prefix="/eval", tags=["Eval"])
 
+_controller: EvalController | None = None
+_controller_pid: int | None = None
+
 
 def get_eval_controller():
-    """Summary of `get_eval_controller`.
+    """Return this process's controller, built on first use.
 
-    Args:
-        (no arguments)
+    The controller, service and `EvalImpl` hold no per-request state, so one
+    instance per process serves every request; a forked worker builds its
+    own instead of inheriting the parent's executor.
 
     Returns:
-        Any: Description of return value.
+        EvalController: Shared controller.
 
     """
-    return EvalController(EvalService())
+    global _controller, _controller_pid
+    if _controller is None or _controller_pid != os.getpid():
+        _controller = EvalController(EvalService(), get_eval_executor())
+        _controller_pid = os.getpid()
+    return _controller
 
 
 @router.post("", summary="Run evaluation on an agent response")
@@ -42,3 +52,37 @@ async def eval_route(
 
     """
     return await controller.run(request)
+
+
+@router.post("/batch", summary="Run evaluation on a batch of agent responses")
+async def eval_batch_route(
+    request: Request, controller: EvalController = Depends(get_eval_controller)
+):
+    """Summary of `eval_batch_route`.
+
+    Args:
+        request (Request): Description of request.
+        controller (EvalController): Description of controller, default=Depends(get_eval_controller).
+
+    Returns:
+        Any: Description of return value.
+
+    """
+    return await controller.run_batch(request)
+
+
+@router.post("/stream", summary="Stream evaluations for an NDJSON body")
+async def eval_stream_route(
+    request: Request, controller: EvalController = Depends(get_eval_controller)
+):
+    """Summary of `eval_stream_route`.
+
+    Args:
+        request (Request): Description of request.
+        controller (EvalController): Description of controller, default=Depends(get_eval_controller).
+
+    Returns:
+        Any: Description of return value.
+
+    """
+    return await controller.run_stream(request)
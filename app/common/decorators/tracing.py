@@ -7,16 +7,16 @@ Generated on 2025-08-15.
 """
 
 import os
+import threading
 from functools import wraps
 
 from opentelemetry import trace
-from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
-from opentelemetry.sdk.resources import Resource
-from opentelemetry.sdk.trace import TracerProvider
-from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
 
 from app.enums.env import EnvName
 
+_tracing_pid: int | None = None
+_tracing_lock = threading.Lock()
+
 
 def setup_tracing(service_name: str = "enterprise_agent") -> None:
     """Summary of `setup_tracing`.
@@ -25,6 +25,15 @@ def setup_tracing(service_name: str = "enterprise_agent") -> None:
         service_name (str): Description of service_name, default='enterprise_agent'.
 
     """
+    # The SDK and the gRPC exporter are slow to import; only pay for them
+    # when tracing is actually set up.
+    from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import (
+        OTLPSpanExporter,
+    )
+    from opentelemetry.sdk.resources import Resource
+    from opentelemetry.sdk.trace import TracerProvider
+    from opentelemetry.sdk.trace.export import BatchSpanProcessor, ConsoleSpanExporter
+
     resource = Resource.create({"service.name": service_name})
     provider = TracerProvider(resource=resource)
     trace.set_tracer_provider(provider)
@@ -37,6 +46,24 @@ def setup_tracing(service_name: str = "enterprise_agent") -> None:
     )
 
 
+def init_tracing(service_name: str = "enterprise_agent") -> None:
+    """Run `setup_tracing` once per process.
+
+    Tracers obtained earlier through `get_tracer` are proxies and start
+    exporting once this has run.
+
+    Args:
+        service_name (str): Service name for exported spans.
+    """
+    global _tracing_pid
+    if _tracing_pid == os.getpid():
+        return
+    with _tracing_lock:
+        if _tracing_pid != os.getpid():
+            setup_tracing(service_name)
+            _tracing_pid = os.getpid()
+
+
 def get_tracer(module_name: str = __name__):
     """Summary of `get_tracer`.
 
@@ -65,6 +92,7 @@ def trace_span(name: str):
 
         @wraps(func)
         def wrapper(*args, **kwargs):
+            init_tracing()
             tracer = get_tracer()
             with tracer.start_as_current_span(name) as span:
                 return func(*args, **kwargs)
@@ -6,8 +6,12 @@ Docstrings follow the Google Python style guide for consistency and clarity.
 Generated on 2025-08-15.
 """
 
+import fcntl
+import os
+import threading
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List
+from typing import Iterator, List
 
 from app.common.decorators.errors import error_boundary
 from app.common.utils.logger import setup_logger
@@ -34,3 +38,58 @@ def find_files_by_extension(directory: str, extensions: List[str]) -> List[str]:
         "Found files", directory=directory, count=len(files), extensions=extensions
     )
     return [str(f) for f in files]
+
+
+class FileLock:
+    """Inter-process lock on a lock file, reentrant within a process.
+
+    Writers take it exclusively and readers shared, through `flock`, so a
+    process never observes another one's half-finished multi-file update.
+    Nested holds in the same process reuse the outer one; a shared hold
+    cannot be upgraded.
+    """
+
+    def __init__(self, path: str) -> None:
+        """Initialize the lock; the file is created on first use.
+
+        Args:
+            path (str): Lock file path.
+        """
+        self.path = path
+        self._lock = threading.RLock()
+        self._depth = 0
+        self._exclusive = False
+
+    @contextmanager
+    def hold(self, exclusive: bool = True) -> Iterator[None]:
+        """Hold the lock for the duration of the block.
+
+        Args:
+            exclusive (bool): Exclusive (writer) rather than shared (reader)
+                lock, default=True.
+
+        Raises:
+            RuntimeError: When asking for an exclusive hold inside a shared
+                one.
+        """
+        with self._lock:
+            if self._depth:
+                if exclusive and not self._exclusive:
+                    raise RuntimeError(f"{self.path} is held shared, not exclusive")
+                self._depth += 1
+                try:
+                    yield
+                finally:
+                    self._depth -= 1
+                return
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX if exclusive else fcntl.LOCK_SH)
+                self._depth, self._exclusive = 1, exclusive
+                try:
+                    yield
+                finally:
+                    self._depth = 0
+            finally:
+                os.close(fd)
@@ -0,0 +1,52 @@
+"""Module documentation for `app/common/utils/memory.py`.
+
+This module is part of an enterprise-grade, research-ready codebase.
+Docstrings follow the Google Python style guide for consistency and clarity.
+
+Generated on 2025-08-16.
+"""
+
+from __future__ import annotations
+
+import os
+from typing import Dict
+
+_ROLLUP_FIELDS = {
+    "Rss": "rss_kb",
+    "Pss": "pss_kb",
+    "Shared_Clean": "shared_clean_kb",
+    "Shared_Dirty": "shared_dirty_kb",
+    "Private_Clean": "private_clean_kb",
+    "Private_Dirty": "private_dirty_kb",
+    "Swap": "swap_kb",
+}
+
+
+def process_memory(pid: int | None = None) -> Dict[str, int]:
+    """Resident memory of a process, split into shared and unique pages.
+
+    Reads `/proc/<pid>/smaps_rollup` (Linux 4.14+). `uss_kb` is the memory
+    that would be freed if the process exited; `pss_kb` charges each shared
+    page proportionally to the processes mapping it, so PSS summed over
+    workers is their true combined footprint.
+
+    Args:
+        pid (int | None): Process id, default=None for the current process.
+
+    Returns:
+        Dict[str, int]: Sizes in KiB, or an empty dict where unavailable.
+    """
+    path = f"/proc/{pid or os.getpid()}/smaps_rollup"
+    out: Dict[str, int] = {}
+    try:
+        with open(path) as fh:
+            for line in fh:
+                key, _, rest = line.partition(":")
+                field = _ROLLUP_FIELDS.get(key)
+                if field:
+                    out[field] = int(rest.split()[0])
+    except (OSError, ValueError, IndexError):
+        return {}
+    out["uss_kb"] = out.get("private_clean_kb", 0) + out.get("private_dirty_kb", 0)
+    out["pid"] = pid or os.getpid()
+    return out
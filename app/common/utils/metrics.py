@@ -0,0 +1,181 @@
+"""Module documentation for `app/common/utils/metrics.py`.
+
+This module is part of an enterprise-grade, research-ready codebase.
+Docstrings follow the Google Python style guide for consistency and clarity.
+
+Generated on 2025-08-16.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from typing import Any, Callable, Dict
+
+_lock = threading.Lock()
+_counters: Dict[str, "Counter"] = {}
+_histograms: Dict[str, "Histogram"] = {}
+_collectors: Dict[str, Callable[[], Dict[str, Any]]] = {}
+
+
+class Counter:
+    """Thread-safe monotonically increasing counter."""
+
+    def __init__(self) -> None:
+        """Initialize the counter at zero."""
+        self._lock = threading.Lock()
+        self._value = 0
+
+    def inc(self, amount: int = 1) -> None:
+        """Increase the counter.
+
+        Args:
+            amount (int): Increment, default=1.
+        """
+        with self._lock:
+            self._value += amount
+
+    @property
+    def value(self) -> int:
+        """Return the current count."""
+        return self._value
+
+
+class Histogram:
+    """Thread-safe histogram over a bounded reservoir of recent samples.
+
+    Count and sum cover every observation; percentiles are computed from
+    the most recent `window` samples.
+    """
+
+    def __init__(self, window: int = 2048) -> None:
+        """Initialize an empty histogram.
+
+        Args:
+            window (int): Number of recent samples kept for percentiles, default=2048.
+        """
+        self._lock = threading.Lock()
+        self._samples: deque[float] = deque(maxlen=window)
+        self._count = 0
+        self._sum = 0.0
+
+    def observe(self, value: float) -> None:
+        """Record one sample.
+
+        Args:
+            value (float): Observed value.
+        """
+        with self._lock:
+            self._samples.append(value)
+            self._count += 1
+            self._sum += value
+
+    def drain(self) -> list[float]:
+        """Return and clear the retained samples; count and sum are kept.
+
+        Returns:
+            list[float]: Samples observed since the last drain, oldest first.
+        """
+        with self._lock:
+            samples = list(self._samples)
+            self._samples.clear()
+        return samples
+
+    def snapshot(self) -> Dict[str, float]:
+        """Summarize the histogram.
+
+        Returns:
+            Dict[str, float]: count, mean, p50, p90, p99 and max.
+        """
+        with self._lock:
+            samples = sorted(self._samples)
+            count, total = self._count, self._sum
+        if not samples:
+            return {
+                "count": count,
+                "mean": 0.0,
+                "p50": 0.0,
+                "p90": 0.0,
+                "p99": 0.0,
+                "max": 0.0,
+            }
+        return {
+            "count": count,
+            "mean": round(total / count, 3),
+            "p50": round(percentile(samples, 50), 3),
+            "p90": round(percentile(samples, 90), 3),
+            "p99": round(percentile(samples, 99), 3),
+            "max": round(samples[-1], 3),
+        }
+
+
+def percentile(sorted_samples: list[float], pct: float) -> float:
+    """Nearest-rank percentile of already sorted samples.
+
+    Args:
+        sorted_samples (list[float]): Samples in ascending order.
+        pct (float): Percentile in [0, 100].
+
+    Returns:
+        float: The percentile value, or 0.0 for no samples.
+    """
+    if not sorted_samples:
+        return 0.0
+    rank = max(
+        0, min(len(sorted_samples) - 1, round(pct / 100 * len(sorted_samples)) - 1)
+    )
+    return sorted_samples[rank]
+
+
+def counter(name: str) -> Counter:
+    """Return the process-wide counter registered under `name`.
+
+    Args:
+        name (str): Metric name.
+
+    Returns:
+        Counter: Existing or newly created counter.
+    """
+    with _lock:
+        return _counters.setdefault(name, Counter())
+
+
+def histogram(name: str) -> Histogram:
+    """Return the process-wide histogram registered under `name`.
+
+    Args:
+        name (str): Metric name.
+
+    Returns:
+        Histogram: Existing or newly created histogram.
+    """
+    with _lock:
+        return _histograms.setdefault(name, Histogram())
+
+
+def register_collector(name: str, collect: Callable[[], Dict[str, Any]]) -> None:
+    """Register a callable whose output is included in `metrics_snapshot`.
+
+    Args:
+        name (str): Section name in the snapshot.
+        collect (Callable[[], Dict[str, Any]]): Returns the section's values.
+    """
+    with _lock:
+        _collectors[name] = collect
+
+
+def metrics_snapshot() -> Dict[str, Any]:
+    """Collect every counter, histogram and registered collector.
+
+    Returns:
+        Dict[str, Any]: JSON-serializable metrics.
+    """
+    with _lock:
+        counters = dict(_counters)
+        histograms = dict(_histograms)
+        collectors = dict(_collectors)
+    return {
+        "counters": {k: c.value for k, c in sorted(counters.items())},
+        "histograms": {k: h.snapshot() for k, h in sorted(histograms.items())},
+        **{k: collect() for k, collect in sorted(collectors.items())},
+    }
@@ -6,8 +6,13 @@ Docstrings follow the Google Python style guide for consistency and clarity.
 Generated on 2025-08-15.
 """
 
+import re
+from typing import List
+
 from app.common.decorators.errors import error_boundary
 
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+|\n+")
+
 
 @error_boundary(default_return="[truncated]")
 def truncate_string(s: str, max_length: int = 200) -> str:
@@ -27,3 +32,48 @@ def truncate_string(s: str, max_length: int = 200) -> str:
     if not isinstance(s, str):
         raise TypeError("truncate_string expects a string")
     return s if len(s) <= max_length else s[:max_length] + "..."
+
+
+def split_sentences(text: str) -> List[str]:
+    """Split text after sentence punctuation and at line breaks.
+
+    Args:
+        text (str): Text to split.
+
+    Returns:
+        List[str]: Non-empty stripped sentences in order.
+    """
+    return [part.strip() for part in _SENTENCE_BREAK.split(text) if part.strip()]
+
+
+def chunk_text(text: str, max_words: int) -> List[str]:
+    """Pack whole sentences into chunks of at most `max_words` words.
+
+    Text that already fits is returned unchanged as a single chunk; a
+    sentence longer than `max_words` is cut at word boundaries.
+
+    Args:
+        text (str): Text to chunk.
+        max_words (int): Word budget per chunk; values below 1 are
+            treated as 1.
+
+    Returns:
+        List[str]: Chunks in order; empty for blank text.
+    """
+    max_words = max(max_words, 1)
+    if len(text.split()) <= max_words:
+        return [text] if text.strip() else []
+    chunks: List[str] = []
+    current: List[str] = []
+    for sentence in split_sentences(text):
+        words = sentence.split()
+        if current and len(current) + len(words) > max_words:
+            chunks.append(" ".join(current))
+            current = []
+        while len(words) > max_words:
+            chunks.append(" ".join(words[:max_words]))
+            words = words[max_words:]
+        current.extend(words)
+    if current:
+        chunks.append(" ".join(current))
+    return chunks
@@ -1,6 +1,198 @@
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Tuple
 
-from app.integrations.config.config_integration import ConfigIntegration
+from app.common.utils.logger import setup_logger
+from app.common.utils.metrics import counter, register_collector
+from app.constants.values import CONFIG_LOCAL_PATH, CONFIG_REFRESH_SEC
 from app.integrations.config.config_schema import ConfigRequest
 
+logger = setup_logger()
 
-config: ConfigRequest = ConfigIntegration().load()
\ No newline at end of file
+ConfigListener = Callable[[ConfigRequest, ConfigRequest], None]
+
+_config: ConfigRequest | None = None
+_config_lock = threading.Lock()
+_integration: Any = None
+_current: Any = None
+_listeners: List[Tuple[str, ConfigListener]] = []
+_refresher_pid: int | None = None
+
+
+def init_config(refresh: bool = True) -> ConfigRequest:
+    """Load the configuration now; later calls return the live snapshot.
+
+    A snapshot of the last good payload is used immediately when one exists
+    and is refreshed from the config server in the background; without one,
+    this blocks on the server. Starts the refresh thread for this process.
+
+    Args:
+        refresh (bool): Start the refresh thread, default=True. A process
+            that forks workers passes False so no thread is running at fork
+            time; each child still starts its own on first use.
+
+    Returns:
+        ConfigRequest: Loaded configuration.
+    """
+    global _config, _integration, _current
+    if _config is not None and _refresher_pid == os.getpid():
+        return _config
+    with _config_lock:
+        if _config is None:
+            from app.integrations.config.config_integration import ConfigIntegration
+
+            _integration = ConfigIntegration()
+            snapshot = None if CONFIG_LOCAL_PATH else _integration.read_snapshot()
+            loaded = snapshot
+            if snapshot is not None:
+                try:
+                    _config = _integration.build(snapshot)
+                except ValueError:
+                    loaded = None
+            if loaded is None:
+                loaded = _integration.load_payload()
+                _config = _integration.build(loaded)
+            _current = loaded
+            logger.info("Config loaded", source=loaded.source, version=loaded.version)
+            register_collector("config", config_stats)
+        _start_refresher(immediate=_current.source == "snapshot", enabled=refresh)
+    return _config
+
+
+def on_config_change(section: str, listener: ConfigListener) -> None:
+    """Call `listener(old, new)` after a reload that changed `section`.
+
+    Args:
+        section (str): Dotted path into the config, e.g.
+            `retrieval.embeddings` or `prompts`.
+        listener (ConfigListener): Invalidates whatever was derived from it.
+    """
+    _listeners.append((section, listener))
+
+
+def _section(cfg: ConfigRequest, section: str) -> Any:
+    value: Any = cfg
+    for part in section.split("."):
+        value = getattr(value, part)
+    return value
+
+
+def apply_config(new: ConfigRequest) -> List[str]:
+    """Swap in a new config and notify listeners of the sections that changed.
+
+    The live object is replaced with a single reference assignment, so a
+    reader sees either the old or the new config, never a mix.
+
+    Args:
+        new (ConfigRequest): Validated replacement.
+
+    Returns:
+        List[str]: Registered sections whose value changed.
+    """
+    global _config
+    with _config_lock:
+        old, _config = _config, new
+    if old is None:
+        return []
+    changed = []
+    for section, listener in list(_listeners):
+        if _section(old, section) == _section(new, section):
+            continue
+        changed.append(section)
+        try:
+            listener(old, new)
+        except Exception as exc:
+            logger.error("Config listener failed", section=section, error=str(exc))
+    return sorted(set(changed))
+
+
+def refresh_config() -> bool:
+    """Poll the config server once and apply the payload if it changed.
+
+    Returns:
+        bool: True when a new config was applied.
+    """
+    global _current
+    init_config()
+    if CONFIG_LOCAL_PATH:
+        return False
+    try:
+        fetched = _integration.fetch(_current)
+        if fetched is None:
+            counter("config.unchanged").inc()
+            return False
+        new = _integration.build(fetched)
+    except Exception as exc:
+        counter("config.refresh_errors").inc()
+        logger.warning("Config refresh failed", error=str(exc))
+        return False
+    _integration.write_snapshot(fetched)
+    previous, _current = _current, fetched
+    changed = apply_config(new)
+    counter("config.reloads").inc()
+    logger.info(
+        "Config reloaded",
+        version=fetched.version,
+        previous_version=previous.version if previous else None,
+        invalidated=changed,
+    )
+    return True
+
+
+def _refresh_loop(immediate: bool) -> None:
+    if immediate:
+        refresh_config()
+    while True:
+        time.sleep(CONFIG_REFRESH_SEC)
+        refresh_config()
+
+
+def _start_refresher(immediate: bool, enabled: bool = True) -> None:
+    global _refresher_pid
+    if _refresher_pid == os.getpid():
+        return
+    _refresher_pid = os.getpid()
+    if not enabled or CONFIG_LOCAL_PATH or CONFIG_REFRESH_SEC <= 0:
+        return
+    threading.Thread(
+        target=_refresh_loop, args=(immediate,), name="config_refresh", daemon=True
+    ).start()
+
+
+def config_stats() -> Dict[str, Any]:
+    """Where the live config came from and how refreshes went.
+
+    Returns:
+        Dict[str, Any]: Source, version, fetch age and refresh counters.
+    """
+    current = _current
+    return {
+        "source": current.source if current else None,
+        "version": current.version if current else None,
+        "age_sec": (
+            round(time.time() - current.fetched_at, 1)
+            if current and current.fetched_at
+            else None
+        ),
+        "reloads": counter("config.reloads").value,
+        "unchanged": counter("config.unchanged").value,
+        "refresh_errors": counter("config.refresh_errors").value,
+    }
+
+
+class _LazyConfig:
+    """Stand-in for `ConfigRequest` that always reads the live config.
+
+    Importing `app.config` therefore does no network I/O, and attribute
+    reads see a hot-reloaded config without holding a stale reference.
+    """
+
+    def __getattr__(self, name: str):
+        return getattr(init_config(), name)
+
+    def __repr__(self) -> str:
+        return repr(_config) if _config is not None else "<config: not loaded>"
+
+
+config: ConfigRequest = _LazyConfig()  # type: ignore[assignment]
@@ -9,7 +9,7 @@ Generated on 2025-08-15.
 import os
 from pathlib import Path
 
-USE_HTTP_API = True
+USE_HTTP_API = os.getenv("OLLAMA_USE_HTTP_API", "true").lower() == "true"
 OLLAMA_CLI = "ollama"
 OLLAMA_CMD = "run"
 ENCODING = "utf-8"
@@ -17,4 +17,53 @@ EVAL_SERVICE_URL = os.getenv("EVAL_SERVICE_URL", "http://localhost:8001")
 CONFIG_SERVICE_URL = os.getenv("CONFIG_SERVICE_URL", "http://localhost:8888")
 APP_CONFIG_NAME = os.getenv("APP_CONFIG_NAME", "document_qa_assistant")
 APP_CONFIG_PROFILE = os.getenv("APP_CONFIG_PROFILE", "default")
-CONFIG_TIMEOUT_SEC = float(os.getenv("CONFIG_TIMEOUT_SEC", "5.0"))
\ No newline at end of file
+CONFIG_TIMEOUT_SEC = float(os.getenv("CONFIG_TIMEOUT_SEC", "5.0"))
+CONFIG_LOCAL_PATH = os.getenv("CONFIG_LOCAL_PATH")
+CONFIG_SNAPSHOT_PATH = os.getenv("CONFIG_SNAPSHOT_PATH")
+CONFIG_REFRESH_SEC = float(os.getenv("CONFIG_REFRESH_SEC", "60"))
+EVAL_BATCH_MAX_ITEMS = int(os.getenv("EVAL_BATCH_MAX_ITEMS", "256"))
+EVAL_MAX_WORKERS = int(os.getenv("EVAL_MAX_WORKERS", "4"))
+EVAL_MAX_QUEUE = int(os.getenv("EVAL_MAX_QUEUE", "16"))
+EVAL_RETRY_AFTER_SEC = int(os.getenv("EVAL_RETRY_AFTER_SEC", "2"))
+EVAL_STAGE_WORKERS = int(os.getenv("EVAL_STAGE_WORKERS", "8"))
+EVAL_STREAM_MAX_IN_FLIGHT = int(os.getenv("EVAL_STREAM_MAX_IN_FLIGHT", "8"))
+EVAL_STREAM_MAX_LINE_BYTES = int(os.getenv("EVAL_STREAM_MAX_LINE_BYTES", "1048576"))
+WARMUP_ENABLED = os.getenv("WARMUP_ENABLED", "true").lower() == "true"
+WARMUP_JUDGE = os.getenv("WARMUP_JUDGE", "true").lower() == "true"
+WARMUP_RETRY_MS = int(os.getenv("WARMUP_RETRY_MS", "1000"))
+WARMUP_RETRY_MAX_MS = int(os.getenv("WARMUP_RETRY_MAX_MS", "30000"))
+OLLAMA_BASE_URL = os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
+OLLAMA_TIMEOUT_SEC = float(os.getenv("OLLAMA_TIMEOUT_SEC", "60.0"))
+OLLAMA_MAX_CONNECTIONS = int(os.getenv("OLLAMA_MAX_CONNECTIONS", "8"))
+EMBEDDING_CACHE_ENABLED = os.getenv("EMBEDDING_CACHE_ENABLED", "true").lower() == "true"
+EMBEDDING_CACHE_DIR = os.getenv("EMBEDDING_CACHE_DIR")
+EMBEDDING_CACHE_MAX_MB = int(os.getenv("EMBEDDING_CACHE_MAX_MB", "256"))
+EMBED_VECTOR_DTYPE = os.getenv("EMBED_VECTOR_DTYPE", "float16")
+JUDGE_CACHE_ENABLED = os.getenv("JUDGE_CACHE_ENABLED", "true").lower() == "true"
+JUDGE_CACHE_MAX_ENTRIES = int(os.getenv("JUDGE_CACHE_MAX_ENTRIES", "4096"))
+JUDGE_CACHE_TTL_SEC = float(os.getenv("JUDGE_CACHE_TTL_SEC", "86400"))
+JUDGE_CACHE_PATH = os.getenv("JUDGE_CACHE_PATH")
+TOKEN_INDEX_MAX_DOCS = int(os.getenv("TOKEN_INDEX_MAX_DOCS", "8192"))
+GROUNDING_CHUNK_WORDS = int(os.getenv("GROUNDING_CHUNK_WORDS", "128"))
+ANN_METRIC = os.getenv("ANN_METRIC", "cosine")
+ANN_NPROBE = int(os.getenv("ANN_NPROBE", "8"))
+ANN_TRAIN_MIN = int(os.getenv("ANN_TRAIN_MIN", "4096"))
+BM25_K1 = float(os.getenv("BM25_K1", "1.2"))
+BM25_B = float(os.getenv("BM25_B", "0.75"))
+HYBRID_CANDIDATES = int(os.getenv("HYBRID_CANDIDATES", "50"))
+HYBRID_RRF_K = int(os.getenv("HYBRID_RRF_K", "60"))
+RETRIEVAL_CACHE_ENABLED = (
+    os.getenv("RETRIEVAL_CACHE_ENABLED", "true").lower() == "true"
+)
+RETRIEVAL_CACHE_MAX_ENTRIES = int(os.getenv("RETRIEVAL_CACHE_MAX_ENTRIES", "4096"))
+RETRIEVAL_CACHE_MAX_BYTES = int(os.getenv("RETRIEVAL_CACHE_MAX_BYTES", str(64 << 20)))
+PROMPT_BYTECODE_CACHE_DIR = os.getenv("PROMPT_BYTECODE_CACHE_DIR")
+PROMPT_SOURCE_CACHE_MAX = int(os.getenv("PROMPT_SOURCE_CACHE_MAX", "256"))
+PROMPT_STRICT_PLACEHOLDERS = (
+    os.getenv("PROMPT_STRICT_PLACEHOLDERS", "false").lower() == "true"
+)
+EMBED_ONNX_FILE_NAME = os.getenv("EMBED_ONNX_FILE_NAME")
+EMBED_SCHEDULER_ENABLED = os.getenv("EMBED_SCHEDULER_ENABLED", "true").lower() == "true"
+EMBED_BATCH_MAX_SIZE = int(os.getenv("EMBED_BATCH_MAX_SIZE", "64"))
+EMBED_BATCH_MAX_WAIT_MS = float(os.getenv("EMBED_BATCH_MAX_WAIT_MS", "5"))
+EMBED_BUCKET_SIZE = int(os.getenv("EMBED_BUCKET_SIZE", "32"))
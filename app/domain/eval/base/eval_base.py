@@ -31,6 +31,7 @@ class EvalBase(ABC):
         rendered_prompt: str | None = None,
         raw_input: str | None = None,
         conversation_history: list[str] | None = None,
+        sentence_scores: bool = False,
     ) -> dict[str, Any]:
         """Summary of `run`.
 
@@ -48,6 +49,7 @@ class EvalBase(ABC):
             rendered_prompt (str | None): Description of rendered_prompt, default=None.
             raw_input (str | None): Description of raw_input, default=None.
             conversation_history (list[str] | None): Description of conversation_history, default=None.
+            sentence_scores (bool): Add per-sentence groundedness, default=False.
 
         Returns:
             dict[str, Any]: Description of return value.
@@ -12,15 +12,18 @@ import datetime
 import uuid
 from typing import Any
 
-from app.common.decorators.tracing import get_tracer, setup_tracing, trace_span
+from app.common.decorators.tracing import get_tracer, init_tracing, trace_span
 from app.common.utils.logger import setup_logger
 from app.config import config
 from app.domain.eval.base.eval_base import EvalBase
-from app.domain.eval.utils.eval_utils import compute_scores, trace_eval_span
+from app.domain.eval.utils.eval_utils import (
+    compute_scores,
+    compute_scores_batch,
+    trace_eval_span,
+)
 from app.enums.eval import EvalKey, TraceMetaKey
 
 logger = setup_logger()
-setup_tracing()
 tracer = get_tracer(__name__)
 
 
@@ -43,6 +46,7 @@ class EvalImpl(EvalBase):
         rendered_prompt: str | None = None,
         raw_input: str | None = None,
         conversation_history: list[str] | None = None,
+        sentence_scores: bool = False,
     ) -> dict[str, Any]:
         """Summary of `run`.
 
@@ -60,20 +64,107 @@ class EvalImpl(EvalBase):
             rendered_prompt (str | None): Description of rendered_prompt, default=None.
             raw_input (str | None): Description of raw_input, default=None.
             conversation_history (list[str] | None): Description of conversation_history, default=None.
+            sentence_scores (bool): Add per-sentence groundedness, default=False.
 
         Returns:
             dict[str, Any]: Description of return value.
 
         """
-        trace_id = str(uuid.uuid4())
-        timestamp = datetime.datetime.utcnow().isoformat()
         scores = compute_scores(
             filtered_input=filtered_input,
             response=response,
             retrieved_docs=retrieved_docs,
             conversation_history=conversation_history,
             helpfulness_template=config.prompts.eval.helpfulness.template,
+            sentence_scores=sentence_scores,
+        )
+        return self._finalize(
+            scores,
+            filtered_input=filtered_input,
+            response=response,
+            response_id=response_id,
+            message_id=message_id,
+            session_id=session_id,
+            prompt_version=prompt_version,
+            template_name=template_name,
+            system_prompt=system_prompt,
+            rendered_prompt=rendered_prompt,
+            raw_input=raw_input,
         )
+
+    def run_batch(self, items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Evaluate several responses with one shared embedding pass.
+
+        Args:
+            self: Description of self.
+            items (list[dict[str, Any]]): Keyword arguments accepted by `run`.
+
+        Returns:
+            list[dict[str, Any]]: Results aligned with `items`; a failed item
+            carries an `error` key like a failed `run` would.
+
+        """
+        init_tracing()
+        scores_list = compute_scores_batch(
+            items=items,
+            helpfulness_template=config.prompts.eval.helpfulness.template,
+        )
+        results = []
+        for item, scores in zip(items, scores_list):
+            with tracer.start_as_current_span(EvalKey.AGENT):
+                results.append(
+                    self._finalize(
+                        scores,
+                        filtered_input=item["filtered_input"],
+                        response=item["response"],
+                        response_id=item["response_id"],
+                        message_id=item["message_id"],
+                        session_id=item["session_id"],
+                        prompt_version=item.get("prompt_version"),
+                        template_name=item.get("template_name"),
+                        system_prompt=item.get("system_prompt"),
+                        rendered_prompt=item.get("rendered_prompt"),
+                        raw_input=item.get("raw_input"),
+                    )
+                )
+        return results
+
+    @staticmethod
+    def _finalize(
+        scores: dict[str, Any],
+        *,
+        filtered_input: str,
+        response: str,
+        response_id: str,
+        message_id: str,
+        session_id: str,
+        prompt_version: str | None,
+        template_name: str | None,
+        system_prompt: str | None,
+        rendered_prompt: str | None,
+        raw_input: str | None,
+    ) -> dict[str, Any]:
+        """Attach trace metadata to computed scores and emit the eval span.
+
+        Args:
+            scores (dict[str, Any]): Output of `compute_scores`.
+            filtered_input (str): Description of filtered_input.
+            response (str): Description of response.
+            response_id (str): Description of response_id.
+            message_id (str): Description of message_id.
+            session_id (str): Description of session_id.
+            prompt_version (str | None): Description of prompt_version.
+            template_name (str | None): Description of template_name.
+            system_prompt (str | None): Description of system_prompt.
+            rendered_prompt (str | None): Description of rendered_prompt.
+            raw_input (str | None): Description of raw_input.
+
+        Returns:
+            dict[str, Any]: Scores plus retrieval metadata.
+
+        """
+        trace_id = str(uuid.uuid4())
+        timestamp = datetime.datetime.utcnow().isoformat()
         meta = {
             TraceMetaKey.TRACE_ID: trace_id,
             TraceMetaKey.TRACE_TIMESTAMP: timestamp,
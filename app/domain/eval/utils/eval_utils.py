@@ -9,14 +9,16 @@ Generated on 2025-08-15.
 from __future__ import annotations
 
 import re
-import subprocess
-from typing import Any, Dict, List
+from concurrent.futures import Future
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
 
-from jinja2 import Template
+import numpy as np
 from opentelemetry.trace import get_current_span
-from sentence_transformers import util
 
 from app.common.decorators.errors import error_boundary
+from app.common.utils.executor import submit_stage
+from app.common.utils.strings import chunk_text, split_sentences
 from app.config import config
 from app.constants.errors import (
     COMPUTE_RATING,
@@ -26,34 +28,53 @@ from app.constants.errors import (
     SCORE_GROUNDEDNESS,
     SCORE_HELPFULNESS,
 )
-from app.constants.values import OLLAMA_CLI, OLLAMA_CMD
-from app.domain.retrieval.utils.embeddings_utils import get_embedding_model
+from app.constants.values import EVAL_STAGE_WORKERS, GROUNDING_CHUNK_WORDS
+from app.domain.eval.utils.judge_utils import run_judge
+from app.domain.eval.utils.token_index import get_doc_token_index, tokenize
+from app.domain.prompts.utils.prompt_registry import get_prompt_registry
+from app.domain.retrieval.utils.embeddings_utils import EmbeddingPlan
 from app.enums.eval import HallucinationKey, RatingKey, RetrievalSource
-from app.enums.prompts import ModelType, ScoreKey
+from app.enums.prompts import ScoreKey
+
+
+@lru_cache(maxsize=4096)
+def _doc_chunks(doc: str) -> Tuple[str, ...]:
+    return tuple(chunk_text(doc, GROUNDING_CHUNK_WORDS))
+
+
+def grounding_texts(
+    response: str, retrieved_docs: list[str]
+) -> Tuple[List[str], List[str]]:
+    """Response sentences and unique doc chunks that groundedness compares.
+
+    Docs up to `GROUNDING_CHUNK_WORDS` words are their own single chunk, so
+    they share an embedding with the per-doc retrieval scores.
+
+    Args:
+        response (str): The agent response.
+        retrieved_docs (list[str]): Retrieved documents.
+
+    Returns:
+        Tuple[List[str], List[str]]: Sentences and chunks, in order.
+    """
+    chunks = dict.fromkeys(c for doc in retrieved_docs for c in _doc_chunks(doc))
+    return split_sentences(response), list(chunks)
 
 
 @error_boundary(default_return={"error": SCORE_GROUNDEDNESS})
 def score_groundedness_with_embeddings(
     response: str, retrieved_docs: list[str]
 ) -> float:
-    """Summary of `score_groundedness_with_embeddings`.
+    """Groundedness of `response` against `retrieved_docs`.
 
     Args:
-        response (str): Description of response.
-        retrieved_docs (list[str]): Description of retrieved_docs.
+        response (str): The agent response.
+        retrieved_docs (list[str]): Retrieved documents.
 
     Returns:
-        float: Description of return value.
-
+        float: Mean over response sentences of the best chunk similarity.
     """
-    if not retrieved_docs:
-        return 0.0
-    model = get_embedding_model()
-    doc_text = "\n".join(retrieved_docs)
-    response_emb = model.encode(response, convert_to_tensor=True)
-    doc_emb = model.encode(doc_text, convert_to_tensor=True)
-    similarity = util.pytorch_cos_sim(response_emb, doc_emb).item()
-    return round(similarity, 3)
+    return score_groundedness_from_plan(EmbeddingPlan(), response, retrieved_docs)
 
 
 @error_boundary(default_return={"error": SCORE_HELPFULNESS})
@@ -63,7 +84,7 @@ def score_helpfulness_with_llm(
     response: str,
     helpfulness_template: str,
     conversation_history: list[str] | None = None,
-    model_name: Any = ModelType.LLAMA3,
+    model_name: Any = None,
 ) -> str:
     """Summary of `score_helpfulness_with_llm`.
 
@@ -72,7 +93,7 @@ def score_helpfulness_with_llm(
         response (str): Description of response.
         helpfulness_template (str): Description of helpfulness_template.
         conversation_history (list[str] | None): Description of conversation_history, default=None.
-        model_name (Any): Description of model_name, default=ModelType.LLAMA3.
+        model_name (Any): Judge model override; defaults to `config.models.eval.model_id`.
 
     Returns:
         str: Description of return value.
@@ -86,16 +107,17 @@ def score_helpfulness_with_llm(
         if conversation_history
         else ""
     )
-    judge_prompt = Template(helpfulness_template).render(
-        prompt=prompt, response=response, history_block=history_block
+    judge_prompt = get_prompt_registry().render_source(
+        helpfulness_template,
+        prompt=prompt,
+        response=response,
+        history_block=history_block,
     )
-    result = subprocess.run(
-        [OLLAMA_CLI, OLLAMA_CMD, model_name],
-        input=judge_prompt.encode(),
-        stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
+    return run_judge(
+        judge_prompt,
+        model_name,
+        prompt_version=config.prompts.eval.helpfulness.version,
     )
-    return result.stdout.decode().strip()
 
 
 @error_boundary(default_return={"error": COMPUTE_RATING})
@@ -120,29 +142,69 @@ def compute_rating(grounding_score: float, judgment: str) -> str:
     return RatingKey.FAIL
 
 
+def _hallucination_risk(overlap: int, response_tokens: int) -> str:
+    ratio = overlap / (response_tokens or 1)
+    if ratio > 0.4:
+        return HallucinationKey.LOW
+    if ratio > 0.2:
+        return HallucinationKey.MEDIUM
+    return HallucinationKey.HIGH
+
+
 @error_boundary(default_return={"error": HALLUCINATION_DETECTION})
 def detect_hallucination(response: str, retrieved_docs: list[str]) -> str:
-    """Summary of `detect_hallucination`.
+    """Risk that `response` is not supported by `retrieved_docs`.
+
+    The share of distinct response tokens found in the docs maps to LOW
+    (> 0.4), MEDIUM (> 0.2) or HIGH. Doc token sets come from the shared
+    token index, so recurring chunks are tokenized once.
 
     Args:
-        response (str): Description of response.
-        retrieved_docs (list[str]): Description of retrieved_docs.
+        response (str): The agent response.
+        retrieved_docs (list[str]): Documents retrieved for the response.
 
     Returns:
-        str: Description of return value.
-
+        str: A `HallucinationKey` value.
     """
     if not retrieved_docs:
         return HallucinationKey.HIGH
-    response_tokens = set(response.lower().split())
-    context_tokens = set(" ".join(retrieved_docs).lower().split())
-    overlap = response_tokens & context_tokens
-    ratio = len(overlap) / (len(response_tokens) or 1)
-    if ratio > 0.4:
-        return HallucinationKey.LOW
-    if ratio > 0.2:
-        return HallucinationKey.MEDIUM
-    return HallucinationKey.HIGH
+    response_tokens = tokenize(response)
+    doc_sets = get_doc_token_index().token_sets(retrieved_docs)
+    if len(doc_sets) == 1:
+        overlap = len(response_tokens & doc_sets[0])
+    else:
+        overlap = sum(
+            1 for t in response_tokens if any(t in tokens for tokens in doc_sets)
+        )
+    return _hallucination_risk(overlap, len(response_tokens))
+
+
+@error_boundary(default_return={"error": HALLUCINATION_DETECTION})
+def detect_hallucination_batch(
+    responses: list[str], retrieved_docs: list[str]
+) -> list[str]:
+    """`detect_hallucination` for many responses against the same docs.
+
+    The docs' vocabulary is built once and each response is a single set
+    intersection against it.
+
+    Args:
+        responses (list[str]): Agent responses.
+        retrieved_docs (list[str]): Documents shared by every response.
+
+    Returns:
+        list[str]: A `HallucinationKey` value per response.
+    """
+    if not retrieved_docs:
+        return [HallucinationKey.HIGH for _ in responses]
+    vocabulary = get_doc_token_index().vocabulary(retrieved_docs)
+    out = []
+    for response in responses:
+        response_tokens = tokenize(response)
+        out.append(
+            _hallucination_risk(len(response_tokens & vocabulary), len(response_tokens))
+        )
+    return out
 
 
 @error_boundary(default_return={"error": EXTRACT_SCORE_FROM_JUDGMENT})
@@ -168,8 +230,14 @@ def compute_scores(
     retrieved_docs: list[str],
     conversation_history: list[str] | None,
     helpfulness_template: str,
+    sentence_scores: bool = False,
 ) -> dict:
-    """Summary of `compute_scores`.
+    """Score one evaluation, overlapping the judge call with embedding work.
+
+    The helpfulness judge is started first on the stage pool; the query,
+    each doc, the response sentences and the doc chunks are then
+    deduplicated and encoded together while it is in flight, and every
+    similarity is read from the normalized embedding matrix.
 
     Args:
         filtered_input (str): Description of filtered_input.
@@ -177,27 +245,269 @@ def compute_scores(
         retrieved_docs (list[str]): Description of retrieved_docs.
         conversation_history (list[str] | None): Description of conversation_history.
         helpfulness_template (str): Description of helpfulness_template.
+        sentence_scores (bool): Also return per-sentence support, default=False.
 
     Returns:
         dict: Description of return value.
 
     """
-    grounding_score = score_groundedness_with_embeddings(response, retrieved_docs)
-    helpfulness_output = score_helpfulness_with_llm(
+    helpfulness = start_helpfulness(
         prompt=filtered_input,
         response=response,
         conversation_history=conversation_history,
         helpfulness_template=helpfulness_template,
     )
+    plan = EmbeddingPlan()
+    plan_eval_texts(plan, filtered_input, response, retrieved_docs)
+    plan.encode()
+    return compute_scores_from_plan(
+        plan=plan,
+        filtered_input=filtered_input,
+        response=response,
+        retrieved_docs=retrieved_docs,
+        conversation_history=conversation_history,
+        helpfulness_template=helpfulness_template,
+        helpfulness=helpfulness,
+        sentence_scores=sentence_scores,
+    )
+
+
+def start_helpfulness(
+    *,
+    prompt: str,
+    response: str,
+    conversation_history: list[str] | None,
+    helpfulness_template: str,
+) -> Future:
+    """Start `score_helpfulness_with_llm` on the eval stage pool.
+
+    Args:
+        prompt (str): The filtered user input.
+        response (str): The agent response.
+        conversation_history (list[str] | None): Session conversation history.
+        helpfulness_template (str): Jinja template for the helpfulness judge.
+
+    Returns:
+        Future: Resolves to the judge output, or its error_boundary fallback.
+    """
+    return submit_stage(
+        "eval_stage",
+        EVAL_STAGE_WORKERS,
+        score_helpfulness_with_llm,
+        prompt=prompt,
+        response=response,
+        conversation_history=conversation_history,
+        helpfulness_template=helpfulness_template,
+    )
+
+
+def sentence_groundedness_from_plan(
+    plan: EmbeddingPlan, response: str, retrieved_docs: list[str]
+) -> Tuple[float, List[Dict[str, Any]]]:
+    """Per-sentence support for `response`, from one sentence x chunk matrix.
+
+    Each response sentence is scored by its most similar doc chunk; the
+    groundedness score is the mean of those maxima. Sentences and chunks
+    missing from `plan` are registered and encoded in one extra batch.
+
+    Args:
+        plan (EmbeddingPlan): Plan to read embeddings from.
+        response (str): The agent response.
+        retrieved_docs (list[str]): Retrieved documents.
+
+    Returns:
+        Tuple[float, List[Dict[str, Any]]]: The score rounded to three
+        decimals, and per sentence its text, support score and a preview
+        of the best chunk.
+    """
+    sentences, chunks = grounding_texts(response, retrieved_docs)
+    if not sentences or not chunks:
+        return 0.0, [
+            {"sentence": sentence, "score": 0.0, "chunk": ""} for sentence in sentences
+        ]
+    plan.add_all(sentences)
+    plan.add_all(chunks)
+    matrix = plan.similarity_matrix(sentences, chunks)
+    best = matrix.argmax(axis=1)
+    support = matrix[np.arange(len(sentences)), best]
+    details = [
+        {
+            "sentence": sentence,
+            "score": round(float(score), 3),
+            "chunk": chunks[j][:100],
+        }
+        for sentence, score, j in zip(sentences, support, best)
+    ]
+    return round(float(support.mean()), 3), details
+
+
+@error_boundary(default_return={"error": SCORE_GROUNDEDNESS})
+def score_groundedness_from_plan(
+    plan: EmbeddingPlan, response: str, retrieved_docs: list[str]
+) -> float:
+    """Groundedness of `response` against the retrieved docs, read from `plan`.
+
+    Args:
+        plan (EmbeddingPlan): Plan to read embeddings from.
+        response (str): The agent response.
+        retrieved_docs (list[str]): Documents retrieved for the response.
+
+    Returns:
+        float: See `sentence_groundedness_from_plan`.
+    """
+    return sentence_groundedness_from_plan(plan, response, retrieved_docs)[0]
+
+
+@error_boundary(default_return=None)
+def _plan_groundedness(
+    plan: EmbeddingPlan, response: str, retrieved_docs: list[str]
+) -> Tuple[float, List[Dict[str, Any]]] | None:
+    return sentence_groundedness_from_plan(plan, response, retrieved_docs)
+
+
+def build_doc_metadata_from_plan(
+    plan: EmbeddingPlan, query: str, docs: List[str]
+) -> List[Dict]:
+    """Per-document retrieval metadata with scores read from `plan`.
+
+    Args:
+        plan (EmbeddingPlan): Plan holding the query and every doc.
+        query (str): The filtered user input.
+        docs (List[str]): Retrieved documents.
+
+    Returns:
+        List[Dict]: One entry per doc with chunk preview, source and score.
+    """
+    scores = plan.similarities(query, docs)
+    out: List[Dict] = []
+    for doc, score in zip(docs, scores):
+        source = RetrievalSource.MEMORY if "Agent:" in doc else RetrievalSource.VECTOR
+        out.append(
+            {"chunk": doc[:100], "source": source, "score": round(float(score), 3)}
+        )
+    return out
+
+
+def plan_eval_texts(
+    plan: EmbeddingPlan, filtered_input: str, response: str, retrieved_docs: list[str]
+) -> None:
+    """Register every text one evaluation needs to embed.
+
+    Args:
+        plan (EmbeddingPlan): Plan to extend.
+        filtered_input (str): The filtered user input.
+        response (str): The agent response.
+        retrieved_docs (list[str]): Retrieved documents.
+    """
+    sentences, chunks = grounding_texts(response, retrieved_docs)
+    plan.add_all([filtered_input, *retrieved_docs, *sentences, *chunks])
+
+
+@error_boundary(default_return={"error": COMPUTE_SCORES})
+def compute_scores_from_plan(
+    *,
+    plan: EmbeddingPlan,
+    filtered_input: str,
+    response: str,
+    retrieved_docs: list[str],
+    conversation_history: list[str] | None,
+    helpfulness_template: str,
+    helpfulness: Future | None = None,
+    sentence_scores: bool = False,
+) -> dict:
+    """Score one evaluation whose texts are already registered in `plan`.
+
+    Embedding-based stages run while the judge is in flight; the rating
+    waits only on the groundedness score and the judge output.
+
+    Args:
+        plan (EmbeddingPlan): Plan populated via `plan_eval_texts`.
+        filtered_input (str): The filtered user input.
+        response (str): The agent response.
+        retrieved_docs (list[str]): Retrieved documents.
+        conversation_history (list[str] | None): Session conversation history.
+        helpfulness_template (str): Jinja template for the helpfulness judge.
+        helpfulness (Future | None): Judge already started with
+            `start_helpfulness`; started here when None.
+        sentence_scores (bool): Add `ScoreKey.GROUNDING_SENTENCES`, read from
+            the same similarity matrix as the score, default=False.
+
+    Returns:
+        dict: Same shape as `compute_scores`.
+    """
+    if helpfulness is None:
+        helpfulness = start_helpfulness(
+            prompt=filtered_input,
+            response=response,
+            conversation_history=conversation_history,
+            helpfulness_template=helpfulness_template,
+        )
+    grounded = _plan_groundedness(plan, response, retrieved_docs)
+    if grounded is None:
+        grounding_score, sentences = {"error": SCORE_GROUNDEDNESS}, []
+    else:
+        grounding_score, sentences = grounded
     hallucination_risk = detect_hallucination(response, retrieved_docs)
+    doc_metadata = build_doc_metadata_from_plan(plan, filtered_input, retrieved_docs)
+    helpfulness_output = helpfulness.result()
     rating = compute_rating(grounding_score, helpfulness_output)
-    return {
+    scores = {
         ScoreKey.GROUNDING: grounding_score,
         ScoreKey.HELPFULNESS: helpfulness_output,
         ScoreKey.HALLUCINATION: hallucination_risk,
         ScoreKey.RATING: rating,
-        "retrieval": {"docs": build_doc_metadata(filtered_input, retrieved_docs)},
+        "retrieval": {"docs": doc_metadata},
     }
+    if sentence_scores:
+        scores[ScoreKey.GROUNDING_SENTENCES] = sentences
+    return scores
+
+
+def compute_scores_batch(
+    *, items: list[dict[str, Any]], helpfulness_template: str
+) -> list[dict]:
+    """Score many evaluations with a single embedding pass over the batch.
+
+    Every item's judge call is started up front. Every unique query, doc,
+    response sentence and doc chunk across all items is then encoded in
+    one call while the judges run; each item reads its similarities from the
+    shared matrix. Failures are isolated per item.
+
+    Args:
+        items (list[dict[str, Any]]): Keyword arguments accepted by
+            `compute_scores` except `helpfulness_template`.
+        helpfulness_template (str): Jinja template for the helpfulness judge.
+
+    Returns:
+        list[dict]: Scores aligned with `items`.
+    """
+    judges = [
+        start_helpfulness(
+            prompt=item["filtered_input"],
+            response=item["response"],
+            conversation_history=item.get("conversation_history"),
+            helpfulness_template=helpfulness_template,
+        )
+        for item in items
+    ]
+    plan = EmbeddingPlan()
+    for item in items:
+        plan_eval_texts(
+            plan, item["filtered_input"], item["response"], item["retrieved_docs"]
+        )
+    return [
+        compute_scores_from_plan(
+            plan=plan,
+            filtered_input=item["filtered_input"],
+            response=item["response"],
+            retrieved_docs=item["retrieved_docs"],
+            conversation_history=item.get("conversation_history"),
+            helpfulness_template=helpfulness_template,
+            helpfulness=judge,
+            sentence_scores=item.get("sentence_scores", False),
+        )
+        for item, judge in zip(items, judges)
+    ]
 
 
 def trace_eval_span(meta: dict, scores: dict) -> None:
@@ -227,12 +537,4 @@ def build_doc_metadata(query: str, docs: List[str]) -> List[Dict]:
         List[Dict]: Description of return value.
 
     """
-    model = get_embedding_model()
-    query_embedding = model.encode(query, convert_to_tensor=True)
-    out: List[Dict] = []
-    for doc in docs:
-        doc_embedding = model.encode(doc, convert_to_tensor=True)
-        score = util.pytorch_cos_sim(query_embedding, doc_embedding).item()
-        source = RetrievalSource.MEMORY if "Agent:" in doc else RetrievalSource.VECTOR
-        out.append({"chunk": doc[:100], "source": source, "score": round(score, 3)})
-    return out
+    return build_doc_metadata_from_plan(EmbeddingPlan([query, *docs]), query, docs)
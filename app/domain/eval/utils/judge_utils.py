@@ -0,0 +1,99 @@
+"""Module documentation for `app/domain/eval/utils/judge_utils.py`.
+
+This module is part of an enterprise-grade, research-ready codebase.
+Docstrings follow the Google Python style guide for consistency and clarity.
+
+Generated on 2025-08-16.
+"""
+
+from __future__ import annotations
+
+import time
+
+from app.common.utils.metrics import histogram, register_collector
+from app.config import config
+from app.constants.values import (
+    JUDGE_CACHE_ENABLED,
+    JUDGE_CACHE_MAX_ENTRIES,
+    JUDGE_CACHE_PATH,
+    JUDGE_CACHE_TTL_SEC,
+    USE_HTTP_API,
+)
+from app.domain.eval.utils.judge_cache import JudgeCache
+from app.integrations.ollama.ollama_integration import (
+    generate_with_cli,
+    get_ollama_integration,
+)
+
+_cache: JudgeCache | None = None
+
+
+def get_judge_cache() -> JudgeCache | None:
+    """Return the process-wide judge verdict cache.
+
+    Returns:
+        JudgeCache | None: The cache, or None when `JUDGE_CACHE_ENABLED` is off.
+    """
+    global _cache
+    if _cache is None and JUDGE_CACHE_ENABLED:
+        _cache = JudgeCache(
+            JUDGE_CACHE_MAX_ENTRIES, JUDGE_CACHE_TTL_SEC, JUDGE_CACHE_PATH
+        )
+        register_collector("judge_cache", _cache.stats)
+    return _cache
+
+
+def run_judge(
+    judge_prompt: str,
+    model_name: str | None = None,
+    prompt_version: str | None = None,
+) -> str:
+    """Generate an LLM-as-a-judge verdict with the configured eval model.
+
+    Uses the pooled HTTP client when `USE_HTTP_API` is set, otherwise the
+    `ollama run` CLI. Model, temperature and max tokens come from
+    `config.models.eval`. When `prompt_version` is given, verdicts are
+    served from and stored in the judge cache.
+
+    Args:
+        judge_prompt (str): Rendered judge prompt.
+        model_name (str | None): Model override, default=None.
+        prompt_version (str | None): Version of the template that rendered
+            `judge_prompt`; enables caching, default=None.
+
+    Returns:
+        str: Raw judge output.
+    """
+    eval_model = config.models.eval
+    model = model_name or eval_model.model_id
+    params = {
+        "temperature": eval_model.temperature,
+        "max_tokens": eval_model.max_tokens,
+        "http": USE_HTTP_API,
+    }
+    cache = get_judge_cache() if prompt_version is not None else None
+    if cache is not None:
+        cache.set_version(prompt_version)
+        key = cache.key(judge_prompt, model, params)
+        verdict = cache.get(key)
+        if verdict is not None:
+            return verdict
+
+    started = time.perf_counter()
+    try:
+        if USE_HTTP_API:
+            verdict = get_ollama_integration().generate(
+                judge_prompt,
+                model=model,
+                temperature=eval_model.temperature,
+                max_tokens=eval_model.max_tokens,
+            )
+        else:
+            verdict = generate_with_cli(judge_prompt, model=model)
+    finally:
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        histogram("judge.generate_ms").observe(elapsed_ms)
+
+    if cache is not None and verdict:
+        cache.put(key, verdict, elapsed_ms)
+    return verdict
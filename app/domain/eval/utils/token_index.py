@@ -0,0 +1,136 @@
+"""Module documentation for `app/domain/eval/utils/token_index.py`.
+
+This module is part of an enterprise-grade, research-ready codebase.
+Docstrings follow the Google Python style guide for consistency and clarity.
+
+Generated on 2025-08-16.
+"""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, FrozenSet, List, Sequence
+
+from app.common.utils.metrics import counter, register_collector
+from app.constants.values import TOKEN_INDEX_MAX_DOCS
+
+
+def tokenize(text: str) -> FrozenSet[str]:
+    """Normalize `text` into the token set hallucination scoring compares.
+
+    Lowercases and splits on whitespace. Tokens never span documents, so
+    the union of per-doc sets equals the set of the space-joined docs.
+
+    Args:
+        text (str): Response or document text.
+
+    Returns:
+        FrozenSet[str]: Distinct normalized tokens.
+    """
+    return frozenset(text.lower().split())
+
+
+class DocTokenIndex:
+    """LRU cache of per-document token sets.
+
+    Entries are keyed by document text (looked up through its hash), so a
+    knowledge-base chunk that comes back across requests is lowercased and
+    split once per process instead of on every call.
+    """
+
+    def __init__(self, max_docs: int) -> None:
+        """Initialize the index.
+
+        Args:
+            max_docs (int): Documents kept before evicting the least recent.
+        """
+        self.max_docs = max_docs
+        self._lock = threading.Lock()
+        self._sets: OrderedDict[str, FrozenSet[str]] = OrderedDict()
+        self._hits = counter("token_index.hits")
+        self._misses = counter("token_index.misses")
+
+    def token_sets(self, docs: Sequence[str]) -> List[FrozenSet[str]]:
+        """Token sets for `docs`, tokenizing only the ones not cached.
+
+        Args:
+            docs (Sequence[str]): Document texts.
+
+        Returns:
+            List[FrozenSet[str]]: One set per doc, aligned with `docs`.
+        """
+        out: List[FrozenSet[str] | None] = []
+        missing = []
+        with self._lock:
+            for i, doc in enumerate(docs):
+                tokens = self._sets.get(doc)
+                if tokens is not None:
+                    self._sets.move_to_end(doc)
+                else:
+                    missing.append(i)
+                out.append(tokens)
+        self._hits.inc(len(docs) - len(missing))
+        if not missing:
+            return out  # type: ignore[return-value]
+        self._misses.inc(len(missing))
+        for i in missing:
+            out[i] = tokenize(docs[i])
+        with self._lock:
+            for i in missing:
+                self._sets[docs[i]] = out[i]  # type: ignore[assignment]
+            while len(self._sets) > self.max_docs:
+                self._sets.popitem(last=False)
+        return out  # type: ignore[return-value]
+
+    def vocabulary(self, docs: Sequence[str]) -> FrozenSet[str]:
+        """Union of the token sets of `docs`.
+
+        Args:
+            docs (Sequence[str]): Document texts.
+
+        Returns:
+            FrozenSet[str]: Every token appearing in any doc.
+        """
+        sets = self.token_sets(docs)
+        if len(sets) == 1:
+            return sets[0]
+        return frozenset().union(*sets)
+
+    def clear(self) -> None:
+        """Drop every cached document."""
+        with self._lock:
+            self._sets.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Cache size and hit rate in this process.
+
+        Returns:
+            Dict[str, Any]: Cached docs, hits, misses and hit rate.
+        """
+        hits, misses = self._hits.value, self._misses.value
+        return {
+            "docs": len(self._sets),
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": round(hits / (hits + misses), 4) if hits + misses else 0.0,
+        }
+
+
+_index: DocTokenIndex | None = None
+_index_lock = threading.Lock()
+
+
+def get_doc_token_index() -> DocTokenIndex:
+    """Return the process-wide document token index.
+
+    Returns:
+        DocTokenIndex: Shared index sized by `TOKEN_INDEX_MAX_DOCS`.
+    """
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = DocTokenIndex(TOKEN_INDEX_MAX_DOCS)
+                register_collector("token_index", _index.stats)
+    return _index
@@ -0,0 +1,56 @@
+"""Module documentation for `app/domain/retrieval/base/embedding_backend_base.py`.
+
+This module is part of an enterprise-grade, research-ready codebase.
+Docstrings follow the Google Python style guide for consistency and clarity.
+
+Generated on 2025-08-16.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import List
+
+import numpy as np
+
+
+class EmbeddingBackendBase(ABC):
+    """Runtime that turns texts into embedding vectors.
+
+    Attributes:
+        provider: Provider name the backend was selected by.
+        model_name: Model the vectors come from.
+        device: Device the model runs on.
+        fork_safe: Whether a loaded instance keeps working in a forked child,
+            so it can be loaded once before forking workers.
+    """
+
+    provider: str
+    model_name: str
+    device: str
+    fork_safe: bool = True
+
+    def freeze(self) -> None:
+        """Put the model in inference-only mode before it is shared.
+
+        Called once in a parent process before forking; backends whose
+        weights are written during inference must make them read-only here.
+        """
+
+    @abstractmethod
+    def encode(self, texts: List[str], *, batch_size: int = 32) -> np.ndarray:
+        """Embed texts.
+
+        Args:
+            self: Description of self.
+            texts (List[str]): Texts to embed.
+            batch_size (int): Texts per forward pass, default=32.
+
+        Returns:
+            np.ndarray: Float32 matrix of shape (len(texts), dim).
+
+        Raises:
+            NotImplementedError: Condition when this is raised.
+
+        """
+        raise NotImplementedError
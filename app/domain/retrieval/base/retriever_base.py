@@ -9,7 +9,7 @@ Generated on 2025-08-15.
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Any, Dict, List, Sequence
 
 
 class RetrieverBase(ABC):
@@ -33,6 +33,27 @@ class RetrieverBase(ABC):
         """
         raise NotImplementedError
 
+    def retrieve_many(
+        self, queries: Sequence[str], *, top_k: int = 4
+    ) -> List[List[Dict[str, Any]]]:
+        """Top-k hits for several queries.
+
+        Implementations embed the queries in one batch and search them
+        together; this fallback calls `retrieve` per query and has no scores.
+
+        Args:
+            queries (Sequence[str]): Query texts.
+            top_k (int): Hits per query, default=4.
+
+        Returns:
+            List[List[Dict[str, Any]]]: Hits per query, best first, each
+            with `document` and `score`.
+        """
+        return [
+            [{"document": doc, "score": None} for doc in self.retrieve(q, top_k=top_k)]
+            for q in queries
+        ]
+
     @abstractmethod
     def query(self, question: str, *, top_k: int = 4) -> str:
         """Summary of `query`.
@@ -0,0 +1,244 @@
+"""Module documentation for `app/domain/retrieval/impl/ann_retriever_impl.py`.
+
+This module is part of an enterprise-grade, research-ready codebase.
+Docstrings follow the Google Python style guide for consistency and clarity.
+
+Generated on 2025-08-16.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from typing import Any, Dict, List, Sequence
+
+from app.common.utils.encoding import sha256
+from app.common.utils.metrics import histogram, register_collector
+from app.config import config, on_config_change
+from app.constants.values import ANN_METRIC, ANN_NPROBE, ANN_TRAIN_MIN
+from app.domain.retrieval.base.retriever_base import RetrieverBase
+from app.domain.retrieval.impl.embedding_backend_impl import embedding_cache_id
+from app.domain.retrieval.utils.ann_index import IvfIndex
+from app.domain.retrieval.utils.embeddings_utils import embedding_dim, encode_cached
+from app.domain.retrieval.utils.retrieval_cache import (
+    bump_collection_version,
+    cached_retrieve,
+)
+from app.enums.vector import RetrievalBackend
+
+
+def ann_index_path(collection: str) -> str:
+    """Directory of the ANN index for `collection` and the configured model.
+
+    Args:
+        collection (str): Collection name.
+
+    Returns:
+        str: `<paths.vector_store_dir>/ann/<collection>/<model digest>`.
+    """
+    cfg = config.retrieval.embeddings
+    model = f"{embedding_cache_id(cfg.provider, cfg.model)}:{embedding_dim()}"
+    return os.path.join(
+        config.paths.vector_store_dir, "ann", collection, sha256(model)[:16]
+    )
+
+
+class AnnRetrieverImpl(RetrieverBase):
+    """Retriever backed by an in-process IVF index over memory-mapped vectors.
+
+    Needs no database: documents and their embeddings are persisted under
+    `paths.vector_store_dir` and searched in this process.
+    """
+
+    backend = RetrievalBackend.MEMORY
+
+    def __init__(
+        self,
+        collection: str | None = None,
+        metric: str = ANN_METRIC,
+        path: str | None = None,
+    ) -> None:
+        """Open the index for a collection.
+
+        Args:
+            collection (str | None): Collection name, default=None for
+                `memory.collection_name`.
+            metric (str): A `DistanceMetric`, default=`ANN_METRIC`.
+            path (str | None): Index directory, default=None for
+                `ann_index_path(collection)`.
+        """
+        self.collection = collection or config.memory.collection_name
+        self.index = IvfIndex(
+            path or ann_index_path(self.collection),
+            embedding_dim(),
+            metric,
+            nprobe=ANN_NPROBE,
+            train_min=ANN_TRAIN_MIN,
+        )
+
+    def refresh(self) -> None:
+        """Reload the index if another process has written it since."""
+        self.index.refresh()
+
+    def add_documents(
+        self, documents: Sequence[str], ids: Sequence[str] | None = None
+    ) -> List[str]:
+        """Embed and index documents.
+
+        Args:
+            documents (Sequence[str]): Texts to index.
+            ids (Sequence[str] | None): Document ids, default=None for the
+                sha256 of each text; an existing id is replaced.
+
+        Returns:
+            List[str]: The ids used.
+        """
+        ids = list(ids) if ids is not None else [sha256(d) for d in documents]
+        if documents:
+            self.index.add(ids, encode_cached(list(documents)), documents)
+            bump_collection_version(self.collection)
+        return ids
+
+    def delete_documents(self, ids: Sequence[str]) -> int:
+        """Remove documents by id.
+
+        Args:
+            ids (Sequence[str]): Document ids.
+
+        Returns:
+            int: Number of documents removed.
+        """
+        removed = self.index.delete(ids)
+        if removed:
+            bump_collection_version(self.collection)
+        return removed
+
+    def search(self, query: str, *, top_k: int = 4) -> List[Dict[str, Any]]:
+        """Nearest documents to `query` with their ids and scores.
+
+        Args:
+            query (str): Query text.
+            top_k (int): Documents to return, default=4.
+
+        Returns:
+            List[Dict[str, Any]]: Hits with `id`, `document` and `score`.
+        """
+        qvec = encode_cached([query])[0]
+        started = time.perf_counter()
+        hits = self.index.search(qvec, top_k)
+        histogram("retrieval.search_ms").observe((time.perf_counter() - started) * 1000)
+        return hits
+
+    def retrieve_many(
+        self, queries: Sequence[str], *, top_k: int = 4
+    ) -> List[List[Dict[str, Any]]]:
+        """Hits for several queries: one embedding batch, one batched search.
+
+        Args:
+            queries (Sequence[str]): Query texts.
+            top_k (int): Hits per query, default=4.
+
+        Returns:
+            List[List[Dict[str, Any]]]: Hits per query with `id`, `document`
+            and `score`, best first.
+        """
+        if not queries:
+            return []
+        qvecs = encode_cached(list(queries))
+        started = time.perf_counter()
+        hits = self.index.search_many(qvecs, top_k)
+        histogram("retrieval.search_many_ms").observe(
+            (time.perf_counter() - started) * 1000
+        )
+        return hits
+
+    def retrieve(self, query: str, *, top_k: int = 4) -> List[str]:
+        """Documents most similar to `query`, served from the retrieval cache
+        while the collection is unchanged.
+
+        Args:
+            query (str): Query text.
+            top_k (int): Documents to return, default=4.
+
+        Returns:
+            List[str]: Document texts, best first.
+        """
+        return cached_retrieve(
+            self.backend,
+            self.collection,
+            str(self.index.path),
+            self.index.metric,
+            query,
+            top_k,
+            lambda: [h["document"] for h in self.search(query, top_k=top_k)],
+            refresh=self.refresh,
+        )
+
+    def query(self, question: str, *, top_k: int = 4) -> str:
+        """Retrieved context for `question` as one string.
+
+        Args:
+            question (str): Query text.
+            top_k (int): Documents to include, default=4.
+
+        Returns:
+            str: Documents separated by blank lines.
+        """
+        chunks = self.retrieve(question, top_k=top_k)
+        return "\n\n".join(chunks[:top_k]) if chunks else ""
+
+
+_retriever: RetrieverBase | None = None
+_retriever_pid: int | None = None
+_retriever_lock = threading.Lock()
+
+
+def get_retriever() -> RetrieverBase:
+    """Return this process's retriever for `retrieval.backend`.
+
+    `memory` selects `AnnRetrieverImpl`, `hybrid` the BM25-fused
+    `HybridRetrieverImpl`; anything else the pgvector-backed
+    `RagRetrieverImpl`.
+
+    Returns:
+        RetrieverBase: Shared retriever.
+    """
+    global _retriever, _retriever_pid
+    if _retriever is None or _retriever_pid != os.getpid():
+        with _retriever_lock:
+            if _retriever is None or _retriever_pid != os.getpid():
+                if config.retrieval.backend == RetrievalBackend.MEMORY:
+                    _retriever = AnnRetrieverImpl()
+                    register_collector("ann_index", _retriever.index.stats)
+                elif config.retrieval.backend == RetrievalBackend.HYBRID:
+                    from app.domain.retrieval.impl.hybrid_retriever_impl import (
+                        HybridRetrieverImpl,
+                    )
+
+                    _retriever = HybridRetrieverImpl()
+                    register_collector("ann_index", _retriever.index.stats)
+                    register_collector("bm25_index", _retriever.lexical.stats)
+                else:
+                    from app.domain.retrieval.impl.rag_retriever_impl import (
+                        RagRetrieverImpl,
+                    )
+
+                    _retriever = RagRetrieverImpl()
+                _retriever_pid = os.getpid()
+    return _retriever
+
+
+def _on_retrieval_changed(old: Any, new: Any) -> None:
+    """Reopen the retriever against the new backend, collection or model."""
+    global _retriever
+    _retriever = None
+
+
+for _section in (
+    "retrieval.backend",
+    "retrieval.embeddings",
+    "memory.collection_name",
+    "paths.vector_store_dir",
+):
+    on_config_change(_section, _on_retrieval_changed)
@@ -0,0 +1,246 @@
+"""Module documentation for `app/domain/retrieval/impl/embedding_backend_impl.py`.
+
+This module is part of an enterprise-grade, research-ready codebase.
+Docstrings follow the Google Python style guide for consistency and clarity.
+
+Generated on 2025-08-16.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, List, Type
+
+import numpy as np
+
+from app.common.utils.logger import setup_logger
+from app.constants.values import EMBED_ONNX_FILE_NAME
+from app.domain.retrieval.base.embedding_backend_base import EmbeddingBackendBase
+from app.enums.vector import EmbeddingProvider
+
+logger = setup_logger()
+
+
+def _set_torch_threads(intra_op_threads: int | None) -> None:
+    if intra_op_threads:
+        import torch
+
+        torch.set_num_threads(intra_op_threads)
+
+
+class SentenceTransformerBackend(EmbeddingBackendBase):
+    """Reference float32 PyTorch `SentenceTransformer`."""
+
+    provider = EmbeddingProvider.SENTENCE_TRANSFORMERS
+
+    def __init__(
+        self,
+        model_name: str,
+        device: str | None = None,
+        intra_op_threads: int | None = None,
+    ) -> None:
+        """Load the model.
+
+        Args:
+            model_name (str): Hugging Face model id or local path.
+            device (str | None): Torch device, default=None to let
+                `SentenceTransformer` pick CUDA when available.
+            intra_op_threads (int | None): Threads per forward pass; the
+                runtime default when None.
+        """
+        self.model_name = model_name
+        self.device = device
+        self.intra_op_threads = intra_op_threads
+        self.model = self._load()
+
+    def _load(self) -> Any:
+        from sentence_transformers import SentenceTransformer
+
+        _set_torch_threads(self.intra_op_threads)
+        return SentenceTransformer(self.model_name, device=self.device)
+
+    def freeze(self) -> None:
+        """Switch to eval mode and stop tracking gradients on the weights.
+
+        Inference then never writes to parameter storage, so forked workers
+        keep sharing the parent's weight pages.
+        """
+        self.model.eval()
+        for param in self.model.parameters():
+            param.requires_grad_(False)
+
+    def encode(self, texts: List[str], *, batch_size: int = 32) -> np.ndarray:
+        """Embed texts.
+
+        Args:
+            texts (List[str]): Texts to embed.
+            batch_size (int): Texts per forward pass, default=32.
+
+        Returns:
+            np.ndarray: Float32 matrix of shape (len(texts), dim).
+        """
+        return np.asarray(
+            self.model.encode(texts, batch_size=batch_size, convert_to_numpy=True),
+            dtype=np.float32,
+        )
+
+
+class QuantizedTorchBackend(SentenceTransformerBackend):
+    """`SentenceTransformer` with Linear layers dynamically quantized to int8.
+
+    Weights are stored as int8 and activations quantized on the fly, which
+    roughly halves the transformer's matmul cost on CPUs with VNNI/AVX512.
+    """
+
+    provider = EmbeddingProvider.TORCH_INT8
+
+    def _load(self) -> Any:
+        import torch
+        from sentence_transformers import SentenceTransformer
+
+        if self.device not in (None, "cpu"):
+            raise ValueError("torch-int8 dynamic quantization runs on CPU only")
+        self.device = "cpu"
+        _set_torch_threads(self.intra_op_threads)
+        model = SentenceTransformer(self.model_name, device="cpu")
+        return torch.quantization.quantize_dynamic(
+            model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+
+
+class OnnxBackend(SentenceTransformerBackend):
+    """`SentenceTransformer` running on ONNX Runtime.
+
+    Set `EMBED_ONNX_FILE_NAME` to pick a specific export from the model
+    repository, e.g. a pre-quantized `onnx/model_qint8_avx512_vnni.onnx`.
+    The ONNX Runtime session owns native thread pools that do not survive
+    `fork`, so each worker loads its own.
+    """
+
+    provider = EmbeddingProvider.ONNX
+    fork_safe = False
+
+    def _load(self) -> Any:
+        try:
+            import onnxruntime
+
+            # sentence-transformers runs its ONNX backend through optimum.
+            import optimum.onnxruntime  # noqa: F401
+        except ImportError as exc:
+            raise ImportError(
+                "The onnx embedding provider needs optimum and onnxruntime: "
+                "pip install -r requirements-onnx.txt"
+            ) from exc
+        from sentence_transformers import SentenceTransformer
+
+        # requirements-onnx.txt installs the CPU build of onnxruntime; the
+        # CUDA provider is opted into by setting the device.
+        self.device = self.device or "cpu"
+        model_kwargs: Dict[str, Any] = {
+            "provider": (
+                "CUDAExecutionProvider"
+                if self.device.startswith("cuda")
+                else "CPUExecutionProvider"
+            )
+        }
+        if self.intra_op_threads:
+            options = onnxruntime.SessionOptions()
+            options.intra_op_num_threads = self.intra_op_threads
+            model_kwargs["session_options"] = options
+        if EMBED_ONNX_FILE_NAME:
+            model_kwargs["file_name"] = EMBED_ONNX_FILE_NAME
+        return SentenceTransformer(
+            self.model_name,
+            device=self.device,
+            backend="onnx",
+            model_kwargs=model_kwargs,
+        )
+
+
+_BACKENDS: Dict[str, Type[SentenceTransformerBackend]] = {
+    EmbeddingProvider.SENTENCE_TRANSFORMERS: SentenceTransformerBackend,
+    EmbeddingProvider.TORCH_INT8: QuantizedTorchBackend,
+    EmbeddingProvider.ONNX: OnnxBackend,
+}
+
+
+def resolve_provider(provider: str | None) -> EmbeddingProvider:
+    """Map a configured provider name to a known backend.
+
+    Unknown names fall back to the reference backend with a warning, since
+    earlier configs used the field only as a label.
+
+    Args:
+        provider (str | None): Value of `retrieval.embeddings.provider`.
+
+    Returns:
+        EmbeddingProvider: Backend provider.
+    """
+    name = (provider or "").strip().lower().replace("_", "-")
+    if name in _BACKENDS:
+        return EmbeddingProvider(name)
+    if name:
+        logger.warning(
+            "Unknown embedding provider, using sentence-transformers",
+            provider=provider,
+        )
+    return EmbeddingProvider.SENTENCE_TRANSFORMERS
+
+
+def backend_is_fork_safe(provider: str | None) -> bool:
+    """Whether the provider's backend may be loaded before forking workers.
+
+    Args:
+        provider (str | None): Configured provider.
+
+    Returns:
+        bool: The backend class's `fork_safe` flag.
+    """
+    return _BACKENDS[resolve_provider(provider)].fork_safe
+
+
+def embedding_cache_id(provider: str | None, model_name: str) -> str:
+    """Identity under which a backend's vectors are cached.
+
+    Args:
+        provider (str | None): Configured provider.
+        model_name (str): Model id.
+
+    Returns:
+        str: The model id for the reference backend, otherwise qualified by
+        provider since other runtimes produce slightly different vectors.
+    """
+    resolved = resolve_provider(provider)
+    if resolved == EmbeddingProvider.SENTENCE_TRANSFORMERS:
+        return model_name
+    return f"{model_name}@{resolved}"
+
+
+def create_embedding_backend(
+    provider: str | None,
+    model_name: str,
+    device: str | None = None,
+    intra_op_threads: int | None = None,
+) -> EmbeddingBackendBase:
+    """Instantiate the backend for a provider.
+
+    Args:
+        provider (str | None): `sentence-transformers`, `onnx` or `torch-int8`.
+        model_name (str): Model id.
+        device (str | None): Device, default=None for the backend's
+            default: CUDA when available for `sentence-transformers`, CPU
+            otherwise.
+        intra_op_threads (int | None): Threads per forward pass, default=None.
+
+    Returns:
+        EmbeddingBackendBase: Loaded backend.
+    """
+    resolved = resolve_provider(provider)
+    backend = _BACKENDS[resolved](model_name, device, intra_op_threads)
+    logger.info(
+        "Embedding backend loaded",
+        provider=str(resolved),
+        model=model_name,
+        device=backend.device,
+        intra_op_threads=intra_op_threads,
+    )
+    return backend
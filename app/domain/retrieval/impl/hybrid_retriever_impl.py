@@ -0,0 +1,236 @@
+"""Module documentation for `app/domain/retrieval/impl/hybrid_retriever_impl.py`.
+
+This module is part of an enterprise-grade, research-ready codebase.
+Docstrings follow the Google Python style guide for consistency and clarity.
+
+Generated on 2025-08-16.
+"""
+
+from __future__ import annotations
+
+import time
+from typing import Any, Dict, List, Sequence, Tuple
+
+import numpy as np
+
+from app.common.utils.logger import setup_logger
+from app.common.utils.metrics import histogram
+from app.constants.values import (
+    ANN_METRIC,
+    BM25_B,
+    BM25_K1,
+    HYBRID_CANDIDATES,
+    HYBRID_RRF_K,
+)
+from app.domain.retrieval.impl.ann_retriever_impl import AnnRetrieverImpl
+from app.domain.retrieval.utils.bm25_index import Bm25Index
+from app.domain.retrieval.utils.embeddings_utils import encode_cached
+from app.domain.retrieval.utils.retrieval_cache import bump_collection_version
+from app.enums.vector import RetrievalBackend
+
+logger = setup_logger()
+
+
+def rrf_fuse(
+    rankings: Sequence[Sequence[str]], k: int, rrf_k: int = HYBRID_RRF_K
+) -> List[Tuple[str, float]]:
+    """Reciprocal rank fusion of several best-first id lists.
+
+    Each list contributes `1 / (rrf_k + rank)` to the ids it ranks, with
+    ranks starting at 1; ids are ordered by the summed contribution.
+
+    Args:
+        rankings (Sequence[Sequence[str]]): Ids per ranker, best first.
+        k (int): Ids to return.
+        rrf_k (int): Rank offset damping the head of each list,
+            default=`HYBRID_RRF_K`.
+
+    Returns:
+        List[Tuple[str, float]]: `(id, fused score)` pairs, best first.
+    """
+    ids = [doc_id for ranking in rankings for doc_id in ranking]
+    if k <= 0 or not ids:
+        return []
+    weights = np.concatenate(
+        [1.0 / (rrf_k + np.arange(1, len(ranking) + 1)) for ranking in rankings]
+    )
+    unique, inverse = np.unique(np.asarray(ids, dtype=object), return_inverse=True)
+    fused = np.bincount(inverse, weights=weights)
+    order = np.argsort(-fused, kind="stable")[:k]
+    return list(zip(unique[order].tolist(), fused[order].tolist()))
+
+
+class HybridRetrieverImpl(AnnRetrieverImpl):
+    """Dense IVF search fused with BM25 over the same collection.
+
+    The BM25 index lives beside the vector index and is written with it.
+    It records the vector index's on-disk write count after each write, so
+    when the collection was written without it (under the `memory` backend,
+    in this or another process, or by a run that stopped between the two
+    writes) it is rebuilt from the stored documents before the next search. Each query takes the best
+    `candidates` from either side and merges them with reciprocal rank
+    fusion, which needs no score calibration between the two. Exact-term
+    matches (identifiers, error codes, names) that an embedding blurs are
+    recovered by the lexical side, so the answer tends to land higher and a
+    smaller `top_k` suffices.
+    """
+
+    backend = RetrievalBackend.HYBRID
+
+    def __init__(
+        self,
+        collection: str | None = None,
+        metric: str = ANN_METRIC,
+        path: str | None = None,
+        candidates: int = HYBRID_CANDIDATES,
+    ) -> None:
+        """Open the vector and BM25 indexes for a collection.
+
+        A BM25 index that has not seen every write to the vector index is
+        rebuilt from the stored documents.
+
+        Args:
+            collection (str | None): Collection name, default=None for
+                `memory.collection_name`.
+            metric (str): A `DistanceMetric`, default=`ANN_METRIC`.
+            path (str | None): Vector index directory, default=None for
+                `ann_index_path(collection)`.
+            candidates (int): Hits taken from each side before fusion,
+                default=`HYBRID_CANDIDATES`.
+        """
+        super().__init__(collection, metric, path)
+        self.candidates = candidates
+        self.lexical = Bm25Index(
+            str(self.index.path.with_name(self.index.path.name + ".bm25")),
+            k1=BM25_K1,
+            b=BM25_B,
+        )
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Reload both indexes if another process has written them, and
+        rebuild BM25 if the vector index took writes it did not see.
+        """
+        # Both refreshes are a few `stat` calls unless another process wrote.
+        self.index.refresh()
+        self.lexical.refresh()
+        writes = self.index.writes
+        if self.lexical.source_version == writes:
+            return
+        logger.info(
+            "Rebuilding BM25 index",
+            collection=self.collection,
+            synced=self.lexical.source_version,
+            writes=writes,
+        )
+        self.lexical.reset(self.index.items(), writes)
+
+    def add_documents(
+        self, documents: Sequence[str], ids: Sequence[str] | None = None
+    ) -> List[str]:
+        """Embed and index documents in both indexes.
+
+        Args:
+            documents (Sequence[str]): Texts to index.
+            ids (Sequence[str] | None): Document ids, default=None for the
+                sha256 of each text; an existing id is replaced.
+
+        Returns:
+            List[str]: The ids used.
+        """
+        with self.index.lock:
+            ids = super().add_documents(documents, ids)
+            version = self.index.writes
+        if documents:
+            self.lexical.add(ids, documents)
+            self.lexical.advance(version)
+            # Again once both indexes hold the write; a search between the
+            # two would have cached a half-updated result.
+            bump_collection_version(self.collection)
+        return ids
+
+    def delete_documents(self, ids: Sequence[str]) -> int:
+        """Remove documents by id from both indexes.
+
+        Args:
+            ids (Sequence[str]): Document ids.
+
+        Returns:
+            int: Number of documents removed.
+        """
+        with self.index.lock:
+            removed = super().delete_documents(ids)
+            version = self.index.writes
+        if self.lexical.delete(ids):
+            bump_collection_version(self.collection)
+        if removed:
+            self.lexical.advance(version)
+        return removed
+
+    def _fuse(
+        self, query: str, dense: List[Tuple[str, float]], top_k: int
+    ) -> List[Dict[str, Any]]:
+        n = max(top_k, self.candidates)
+        fused = rrf_fuse(
+            [
+                [doc_id for doc_id, _ in dense],
+                [doc_id for doc_id, _ in self.lexical.search(query, n)],
+            ],
+            top_k,
+        )
+        documents = self.index.documents([doc_id for doc_id, _ in fused])
+        return [
+            {"id": doc_id, "document": document, "score": score}
+            for (doc_id, score), document in zip(fused, documents)
+            if document is not None
+        ]
+
+    def search(self, query: str, *, top_k: int = 4) -> List[Dict[str, Any]]:
+        """Best documents for `query` by fused dense and BM25 rank.
+
+        Args:
+            query (str): Query text.
+            top_k (int): Documents to return, default=4.
+
+        Returns:
+            List[Dict[str, Any]]: Hits with `id`, `document` and the fused
+            `score`.
+        """
+        qvec = encode_cached([query])[0]
+        self.refresh()
+        started = time.perf_counter()
+        dense = self.index.search_ids(qvec, max(top_k, self.candidates))
+        hits = self._fuse(query, dense, top_k)
+        histogram("retrieval.search_ms").observe((time.perf_counter() - started) * 1000)
+        return hits
+
+    def retrieve_many(
+        self, queries: Sequence[str], *, top_k: int = 4
+    ) -> List[List[Dict[str, Any]]]:
+        """Hits for several queries: one embedding batch and one batched
+        dense search, then BM25 and fusion per query.
+
+        Args:
+            queries (Sequence[str]): Query texts.
+            top_k (int): Hits per query, default=4.
+
+        Returns:
+            List[List[Dict[str, Any]]]: Hits per query with `id`, `document`
+            and the fused `score`, best first.
+        """
+        if not queries:
+            return []
+        qvecs = encode_cached(list(queries))
+        self.refresh()
+        started = time.perf_counter()
+        dense = self.index.search_ids_many(
+            np.asarray(qvecs), max(top_k, self.candidates)
+        )
+        hits = [
+            self._fuse(query, query_dense, top_k)
+            for query, query_dense in zip(queries, dense)
+        ]
+        histogram("retrieval.search_many_ms").observe(
+            (time.perf_counter() - started) * 1000
+        )
+        return hits
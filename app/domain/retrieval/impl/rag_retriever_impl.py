@@ -8,19 +8,26 @@ Generated on 2025-08-15.
 
 from __future__ import annotations
 
-from typing import List
+from typing import Any, Dict, List, Sequence
 
 from app.config import config
 from app.db.repositories.pgvector_repository import get_pgvector_repo
-from app.domain.retrieval.utils.embeddings_utils import get_cached_embedding
-from app.enums.vector import DistanceMetric
+from app.domain.retrieval.base.retriever_base import RetrieverBase
+from app.domain.retrieval.impl.embedding_backend_impl import embedding_cache_id
+from app.domain.retrieval.utils.embeddings_utils import (
+    encode_cached,
+    get_cached_embedding,
+)
+from app.domain.retrieval.utils.retrieval_cache import cached_retrieve
+from app.enums.vector import DistanceMetric, RetrievalBackend
 
 
-class RagRetrieverImpl:
+class RagRetrieverImpl(RetrieverBase):
     """Summary of `RagRetrieverImpl`."""
 
     def retrieve(self, query: str, *, top_k: int = 4) -> List[str]:
-        """Summary of `retrieve`.
+        """Documents most similar to `query`, served from the retrieval cache
+        while the collection is unchanged.
 
         Args:
             self: Description of self.
@@ -31,12 +38,58 @@ class RagRetrieverImpl:
             List[str]: Description of return value.
 
         """
-        qvec = get_cached_embedding(query)
+        collection = config.memory.collection_name
+        cfg = config.retrieval.embeddings
+
+        def search() -> List[str]:
+            qvec = get_cached_embedding(query)
+            with get_pgvector_repo(distance=DistanceMetric.COSINE) as repo:
+                hits = repo.topk(query_vec=qvec, collection=collection, k=top_k)
+            return [h["document"] for h in hits if h.get("document")]
+
+        return cached_retrieve(
+            RetrievalBackend.POSTGRES,
+            collection,
+            embedding_cache_id(cfg.provider, cfg.model),
+            DistanceMetric.COSINE,
+            query,
+            top_k,
+            search,
+        )
+
+    def retrieve_many(
+        self, queries: Sequence[str], *, top_k: int = 4
+    ) -> List[List[Dict[str, Any]]]:
+        """Hits for several queries with one embedding batch and one session.
+
+        Args:
+            queries (Sequence[str]): Query texts.
+            top_k (int): Hits per query, default=4.
+
+        Returns:
+            List[List[Dict[str, Any]]]: Hits per query with `document` and
+            `score`, best first.
+        """
+        if not queries:
+            return []
+        qvecs = encode_cached(list(queries))
         with get_pgvector_repo(distance=DistanceMetric.COSINE) as repo:
-            hits = repo.topk(
-                query_vec=qvec, collection=config.memory.collection_name, k=top_k
-            )
-        return [h["document"] for h in hits if h.get("document")]
+            results = [
+                repo.topk(
+                    query_vec=qvec.tolist(),
+                    collection=config.memory.collection_name,
+                    k=top_k,
+                )
+                for qvec in qvecs
+            ]
+        return [
+            [
+                {"document": h["document"], "score": h.get("score")}
+                for h in hits
+                if h.get("document")
+            ]
+            for hits in results
+        ]
 
     def query(self, question: str, *, top_k: int = 4) -> str:
         """Summary of `query`.
@@ -0,0 +1,783 @@
+"""Module documentation for `app/domain/retrieval/utils/ann_index.py`.
+
+This module is part of an enterprise-grade, research-ready codebase.
+Docstrings follow the Google Python style guide for consistency and clarity.
+
+Generated on 2025-08-16.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Sequence, Tuple
+
+import numpy as np
+
+from app.common.utils.files import FileLock
+from app.domain.retrieval.utils.vector_utils import normalize_rows
+from app.enums.vector import DistanceMetric
+
+_META = "meta.json"
+_IDS = "ids.txt"
+_TEXTS = "texts.bin"
+_CENTROIDS = "centroids.npy"
+_OFFSETS = "offsets.npy"
+_KMEANS_ITERS = 10
+_KMEANS_SAMPLE_PER_LIST = 64
+_ASSIGN_BLOCK_ROWS = 16384
+_TAIL_REBUILD_SHARE = 0.2
+
+
+class _Column:
+    """Fixed-width rows in a memory-mapped file that grows on demand."""
+
+    def __init__(self, path: Path, dtype: Any, width: int, capacity: int) -> None:
+        self.path = path
+        self.dtype = np.dtype(dtype)
+        self.width = width
+        self.capacity = 0
+        self.data: np.memmap | None = None
+        self.reserve(capacity)
+
+    def _shape(self, capacity: int) -> Tuple[int, ...]:
+        return (capacity, self.width) if self.width > 1 else (capacity,)
+
+    def reserve(self, capacity: int) -> None:
+        if capacity <= self.capacity and self.data is not None:
+            return
+        capacity = max(capacity, 1)
+        nbytes = capacity * self.width * self.dtype.itemsize
+        with open(self.path, "ab") as fh:
+            if fh.tell() < nbytes:
+                fh.truncate(nbytes)
+        if self.data is not None:
+            self.data.flush()
+        self.data = np.memmap(
+            self.path, dtype=self.dtype, mode="r+", shape=self._shape(capacity)
+        )
+        self.capacity = capacity
+
+    def flush(self) -> None:
+        if self.data is not None:
+            self.data.flush()
+
+
+class IvfIndex:
+    """Inverted-file approximate nearest-neighbor index over memory-mapped rows.
+
+    Vectors are clustered with k-means into `nlist` lists; a query scans only
+    the `nprobe` lists whose centroids are closest. Rebuilding lays every
+    list out contiguously, so scanning one is a matrix-vector product on a
+    slice of the memory-mapped file. Rows added afterwards are assigned to a
+    list and scanned from a small per-list tail until the next rebuild;
+    deletes are tombstones dropped on rebuild. Below `train_min` live rows
+    the index is searched exhaustively.
+
+    Several processes may share an index. Writes hold an exclusive lock file
+    next to the index directory and first catch up with the files on disk;
+    readers notice a changed `meta.json` and reopen under a shared lock.
+    `writes` counts the adds and deletes the index has taken and
+    `generation` its rebuilds, both persisted with it, so data kept beside
+    it can tell whether it missed a write.
+
+    Scores are higher-is-better: cosine similarity, inner product, or the
+    negated squared L2 distance.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        dim: int,
+        metric: str = DistanceMetric.COSINE,
+        nprobe: int = 8,
+        train_min: int = 4096,
+    ) -> None:
+        """Open the index at `path`, creating it when missing.
+
+        Args:
+            path (str): Directory holding the index files.
+            dim (int): Vector dimension.
+            metric (str): A `DistanceMetric`, default=`cosine`.
+            nprobe (int): Lists scanned per query, default=8.
+            train_min (int): Live rows before clustering, default=4096.
+
+        Raises:
+            ValueError: When an existing index has another dim or metric.
+        """
+        self.path = Path(path)
+        self.dim = dim
+        self.metric = DistanceMetric(metric)
+        self.nprobe = nprobe
+        self.train_min = train_min
+        self._lock = threading.RLock()
+        self._file_lock = FileLock(str(self.path.with_name(self.path.name + ".lock")))
+        self._texts_fd: int | None = None
+        with self._lock, self._file_lock.hold(exclusive=False):
+            self._open()
+
+    @property
+    def lock(self) -> threading.RLock:
+        """Lock over the in-memory state; hold it across a write to read the
+        `writes` value that write produced."""
+        return self._lock
+
+    def _meta_stamp_now(self) -> Tuple[int, int] | None:
+        try:
+            st = os.stat(self.path / _META)
+        except FileNotFoundError:
+            return None
+        return st.st_ino, st.st_mtime_ns
+
+    def _open(self) -> None:
+        self.path.mkdir(parents=True, exist_ok=True)
+        self._meta_stamp = self._meta_stamp_now()
+        meta_path = self.path / _META
+        meta = json.loads(meta_path.read_text()) if meta_path.exists() else {}
+        if meta and (meta["dim"] != self.dim or meta["metric"] != self.metric):
+            raise ValueError(
+                f"Index at {self.path} is {meta['metric']}/{meta['dim']}d, "
+                f"not {self.metric}/{self.dim}d"
+            )
+        self.count = meta.get("count", 0)
+        self.built = meta.get("built", 0)
+        self.trained_rows = meta.get("trained_rows", 0)
+        self.writes = meta.get("writes", 0)
+        self.generation = meta.get("generation", 0)
+        capacity = max(self.count, 1024)
+        self._vectors = _Column(
+            self.path / "vectors.f32", np.float32, self.dim, capacity
+        )
+        self._norms = _Column(self.path / "norms.f32", np.float32, 1, capacity)
+        self._lists = _Column(self.path / "lists.i32", np.int32, 1, capacity)
+        self._deleted = _Column(self.path / "deleted.u8", np.uint8, 1, capacity)
+        self._spans = _Column(self.path / "spans.i64", np.int64, 2, capacity)
+        self._set_centroids(
+            np.load(self.path / _CENTROIDS) if self.trained_rows else None
+        )
+        self._offsets = np.load(self.path / _OFFSETS) if self.trained_rows else None
+        ids_path = self.path / _IDS
+        # Lines past `count` belong to a write that never reached meta.json.
+        lines = (
+            ids_path.read_bytes().split(b"\n")[: self.count]
+            if ids_path.exists()
+            else []
+        )
+        self._ids_end = sum(len(line) + 1 for line in lines)
+        ids = [line.decode("utf-8") for line in lines]
+        self._ids: List[str] = ids
+        deleted = self._deleted.data[: self.count]
+        self._rows: Dict[str, int] = {
+            doc_id: row for row, doc_id in enumerate(ids) if not deleted[row]
+        }
+        self._text_end = int(self._spans.data[self.count - 1, 1]) if self.count else 0
+        # Held open so reads keep seeing this generation's texts even after
+        # another process swaps in a rebuilt directory.
+        if self._texts_fd is not None:
+            os.close(self._texts_fd)
+        self._texts_fd = os.open(self.path / _TEXTS, os.O_RDONLY | os.O_CREAT, 0o644)
+        self._tails: Dict[int, List[int]] = {}
+        if self._centroids is not None:
+            for row in range(self.built, self.count):
+                self._tails.setdefault(int(self._lists.data[row]), []).append(row)
+
+    def refresh(self) -> None:
+        """Reopen the index if another process has written or rebuilt it."""
+        if self._meta_stamp_now() == self._meta_stamp:
+            return
+        with self._lock, self._file_lock.hold(exclusive=False):
+            stamp = self._meta_stamp_now()
+            if stamp == self._meta_stamp:
+                return
+            meta = json.loads((self.path / _META).read_text()) if stamp else {}
+            if (
+                meta.get("writes", 0) == self.writes
+                and meta.get("generation", 0) == self.generation
+            ):
+                self._meta_stamp = stamp
+                return
+            self._open()
+
+    @contextmanager
+    def _writing(self) -> Iterator[None]:
+        with self._lock, self._file_lock.hold():
+            self.refresh()
+            # Drop what a writer that died before updating meta.json appended.
+            for name, end in ((_IDS, self._ids_end), (_TEXTS, self._text_end)):
+                path = self.path / name
+                if path.exists() and path.stat().st_size > end:
+                    os.truncate(path, end)
+            yield
+
+    def __len__(self) -> int:
+        """Return the number of live (not deleted) vectors."""
+        return len(self._rows)
+
+    @property
+    def nlist(self) -> int:
+        """Number of inverted lists; 0 before the first training."""
+        return 0 if self._centroids is None else len(self._centroids)
+
+    def _set_centroids(self, centroids: np.ndarray | None) -> None:
+        self._centroids = centroids
+        self._centroid_norms = (
+            None if centroids is None else np.einsum("ij,ij->i", centroids, centroids)
+        )
+
+    def _prepare(self, vectors: np.ndarray) -> np.ndarray:
+        vectors = np.ascontiguousarray(vectors, dtype=np.float32)
+        if self.metric == DistanceMetric.COSINE:
+            vectors = normalize_rows(vectors)
+        return vectors
+
+    def _score(self, block: np.ndarray, norms: np.ndarray, query: np.ndarray):
+        scores = block @ query
+        if self.metric == DistanceMetric.L2:
+            # -|x - q|^2 without the constant |q|^2 term.
+            scores = 2.0 * scores - (norms if scores.ndim == 1 else norms[:, None])
+        return scores
+
+    def _centroid_scores(self, vectors: np.ndarray) -> np.ndarray:
+        scores = vectors @ self._centroids.T
+        if self.metric != DistanceMetric.INNER:
+            scores = 2.0 * scores - self._centroid_norms
+        return scores
+
+    def _assign(self, vectors: np.ndarray) -> np.ndarray:
+        out = np.empty(len(vectors), dtype=np.int32)
+        for start in range(0, len(vectors), _ASSIGN_BLOCK_ROWS):
+            block = vectors[start : start + _ASSIGN_BLOCK_ROWS]
+            out[start : start + len(block)] = self._centroid_scores(block).argmax(1)
+        return out
+
+    def add(
+        self,
+        ids: Sequence[str],
+        vectors: np.ndarray,
+        documents: Sequence[str],
+        maintain: bool = True,
+    ) -> None:
+        """Insert or replace vectors with their documents.
+
+        Args:
+            ids (Sequence[str]): Document ids; an existing id is replaced,
+                and of an id repeated within the batch only the last
+                occurrence is kept.
+            vectors (np.ndarray): Float matrix of shape (len(ids), dim).
+            documents (Sequence[str]): Text returned with each hit.
+            maintain (bool): Train or rebuild once the tail grows too large,
+                default=True. Bulk loads pass False and call `rebuild` once.
+
+        Raises:
+            ValueError: When an id contains a line break.
+        """
+        if not len(ids):
+            return
+        if any("\n" in doc_id or "\r" in doc_id for doc_id in ids):
+            raise ValueError("Document ids must not contain line breaks")
+        last = {doc_id: i for i, doc_id in enumerate(ids)}
+        if len(last) < len(ids):
+            keep = sorted(last.values())
+            ids = [ids[i] for i in keep]
+            vectors = np.asarray(vectors)[keep]
+            documents = [documents[i] for i in keep]
+        vectors = self._prepare(vectors)
+        encoded = [doc.encode("utf-8") for doc in documents]
+        with self._writing():
+            self._tombstone(ids)
+            start, end = self.count, self.count + len(ids)
+            for column in self._columns():
+                if end > column.capacity:
+                    column.reserve(max(end, int(column.capacity * 1.5)))
+            self._vectors.data[start:end] = vectors
+            self._norms.data[start:end] = np.einsum("ij,ij->i", vectors, vectors)
+            self._deleted.data[start:end] = 0
+            lengths = np.fromiter((len(b) for b in encoded), np.int64, len(encoded))
+            ends = self._text_end + np.cumsum(lengths)
+            self._spans.data[start:end, 0] = ends - lengths
+            self._spans.data[start:end, 1] = ends
+            with open(self.path / _TEXTS, "ab") as fh:
+                fh.write(b"".join(encoded))
+            id_lines = "".join(f"{doc_id}\n" for doc_id in ids).encode("utf-8")
+            with open(self.path / _IDS, "ab") as fh:
+                fh.write(id_lines)
+            self._ids_end += len(id_lines)
+            self._text_end = int(ends[-1])
+            if self._centroids is not None:
+                lists = self._assign(vectors)
+                self._lists.data[start:end] = lists
+                for row, list_id in zip(range(start, end), lists.tolist()):
+                    self._tails.setdefault(list_id, []).append(row)
+            for row, doc_id in zip(range(start, end), ids):
+                self._ids.append(doc_id)
+                self._rows[doc_id] = row
+            self.count = end
+            self.writes += 1
+            if maintain:
+                self._maintain()
+            self.flush()
+
+    def delete(self, ids: Sequence[str]) -> int:
+        """Remove documents by id.
+
+        Args:
+            ids (Sequence[str]): Document ids.
+
+        Returns:
+            int: Number of ids that were present.
+        """
+        with self._writing():
+            removed = self._tombstone(ids)
+            if removed:
+                self.writes += 1
+                self._deleted.flush()
+                self._write_meta(self.path)
+        return removed
+
+    def _tombstone(self, ids: Sequence[str]) -> int:
+        removed = 0
+        for doc_id in ids:
+            row = self._rows.pop(doc_id, None)
+            if row is not None:
+                self._deleted.data[row] = 1
+                removed += 1
+        return removed
+
+    def _maintain(self) -> None:
+        live = len(self._rows)
+        if self._centroids is None:
+            if live >= self.train_min:
+                self.rebuild(retrain=True)
+            return
+        tail = self.count - self.built
+        if tail > max(self.train_min, _TAIL_REBUILD_SHARE * self.built):
+            self.rebuild(retrain=live > 4 * self.trained_rows)
+
+    def _train(self, live: np.ndarray) -> np.ndarray:
+        nlist = min(int(np.clip(2 * np.sqrt(len(live)), 16, 4096)), len(live))
+        rng = np.random.default_rng(0)
+        sample_rows = np.sort(
+            rng.choice(
+                live, min(len(live), nlist * _KMEANS_SAMPLE_PER_LIST), replace=False
+            )
+        )
+        sample = np.asarray(self._vectors.data[sample_rows])
+        self._set_centroids(
+            sample[rng.choice(len(sample), nlist, replace=False)].copy()
+        )
+        for _ in range(_KMEANS_ITERS):
+            assigned = self._assign(sample)
+            order = np.argsort(assigned, kind="stable")
+            sizes = np.bincount(assigned, minlength=nlist)
+            filled = np.flatnonzero(sizes)
+            starts = np.concatenate(([0], np.cumsum(sizes)[:-1]))[filled]
+            sums = np.empty_like(self._centroids)
+            sums[filled] = np.add.reduceat(sample[order], starts, axis=0)
+            sums[filled] /= sizes[filled, None]
+            empty = sizes == 0
+            sums[empty] = sample[rng.choice(len(sample), int(empty.sum()))]
+            if self.metric == DistanceMetric.COSINE:
+                sums = normalize_rows(sums)
+            self._set_centroids(sums)
+        return self._centroids
+
+    def rebuild(self, retrain: bool = False) -> None:
+        """Re-cluster (optionally) and rewrite rows contiguously per list.
+
+        Drops deleted rows and clears every tail. Writes the new files to a
+        sibling directory and swaps it in.
+
+        Args:
+            retrain (bool): Recompute centroids from the live rows,
+                default=False; always done when the index is untrained.
+        """
+        with self._writing():
+            live = np.flatnonzero(self._deleted.data[: self.count] == 0)
+            self.generation += 1
+            if not len(live):
+                writes, generation = self.writes, self.generation
+                shutil.rmtree(self.path)
+                self._open()
+                self.writes, self.generation = writes, generation
+                self._write_meta(self.path)
+                return
+            if retrain or self._centroids is None:
+                self._train(live)
+            lists = np.empty(len(live), dtype=np.int32)
+            for start in range(0, len(live), _ASSIGN_BLOCK_ROWS):
+                rows = live[start : start + _ASSIGN_BLOCK_ROWS]
+                lists[start : start + len(rows)] = self._assign(
+                    np.asarray(self._vectors.data[rows])
+                )
+            order = np.argsort(lists, kind="stable")
+            rows_sorted = live[order]
+            lists_sorted = lists[order]
+            offsets = np.searchsorted(lists_sorted, np.arange(self.nlist + 1))
+
+            staging = self.path.with_name(self.path.name + ".rebuild")
+            shutil.rmtree(staging, ignore_errors=True)
+            staging.mkdir(parents=True)
+            capacity = max(len(live), 1024)
+            out = {
+                "vectors": _Column(
+                    staging / "vectors.f32", np.float32, self.dim, capacity
+                ),
+                "norms": _Column(staging / "norms.f32", np.float32, 1, capacity),
+                "lists": _Column(staging / "lists.i32", np.int32, 1, capacity),
+                "deleted": _Column(staging / "deleted.u8", np.uint8, 1, capacity),
+                "spans": _Column(staging / "spans.i64", np.int64, 2, capacity),
+            }
+            with open(staging / _TEXTS, "wb") as texts:
+                position = 0
+                for start in range(0, len(rows_sorted), _ASSIGN_BLOCK_ROWS):
+                    rows = rows_sorted[start : start + _ASSIGN_BLOCK_ROWS]
+                    end = start + len(rows)
+                    out["vectors"].data[start:end] = self._vectors.data[rows]
+                    out["norms"].data[start:end] = self._norms.data[rows]
+                    out["lists"].data[start:end] = lists_sorted[start:end]
+                    out["deleted"].data[start:end] = 0
+                    for i, (lo, hi) in enumerate(self._spans.data[rows].tolist()):
+                        blob = os.pread(self._texts_fd, hi - lo, lo)
+                        texts.write(blob)
+                        out["spans"].data[start + i] = (
+                            position,
+                            position + len(blob),
+                        )
+                        position += len(blob)
+            for column in out.values():
+                column.flush()
+            ids = [self._ids[row] for row in rows_sorted.tolist()]
+            (staging / _IDS).write_text("".join(f"{doc_id}\n" for doc_id in ids))
+            np.save(staging / _CENTROIDS, self._centroids)
+            np.save(staging / _OFFSETS, offsets)
+            self.count = self.built = len(live)
+            if retrain or not self.trained_rows:
+                self.trained_rows = len(live)
+            self._write_meta(staging)
+
+            retired = self.path.with_name(self.path.name + ".old")
+            shutil.rmtree(retired, ignore_errors=True)
+            os.replace(self.path, retired)
+            os.replace(staging, self.path)
+            shutil.rmtree(retired, ignore_errors=True)
+            self._open()
+
+    def _columns(self) -> List[_Column]:
+        return [self._vectors, self._norms, self._lists, self._deleted, self._spans]
+
+    def _write_meta(self, directory: Path) -> None:
+        meta = {
+            "dim": self.dim,
+            "metric": str(self.metric),
+            "count": self.count,
+            "built": self.built,
+            "trained_rows": self.trained_rows,
+            "writes": self.writes,
+            "generation": self.generation,
+        }
+        tmp = directory / (_META + ".tmp")
+        tmp.write_text(json.dumps(meta))
+        os.replace(tmp, directory / _META)
+        if directory == self.path:
+            self._meta_stamp = self._meta_stamp_now()
+
+    def flush(self) -> None:
+        """Write pending rows and metadata to disk."""
+        with self._writing():
+            for column in self._columns():
+                column.flush()
+            self._write_meta(self.path)
+
+    def _candidates(
+        self, query: np.ndarray, nprobe: int
+    ) -> Tuple[np.ndarray, np.ndarray]:
+        # Plain ndarray views: slicing a memmap object is several times slower.
+        vectors = np.asarray(self._vectors.data)
+        norms = np.asarray(self._norms.data)
+        if self._centroids is None:
+            rows = np.arange(self.count)
+            return rows, self._score(vectors[: self.count], norms[: self.count], query)
+        probe = self._centroid_scores(query[None, :])[0]
+        nprobe = min(nprobe, len(probe))
+        lists = np.argpartition(-probe, nprobe - 1)[:nprobe]
+        row_parts, score_parts = [], []
+        for list_id in lists.tolist():
+            lo, hi = int(self._offsets[list_id]), int(self._offsets[list_id + 1])
+            if hi > lo:
+                row_parts.append(np.arange(lo, hi))
+                score_parts.append(self._score(vectors[lo:hi], norms[lo:hi], query))
+            tail = self._tails.get(list_id)
+            if tail:
+                rows = np.asarray(tail)
+                row_parts.append(rows)
+                score_parts.append(self._score(vectors[rows], norms[rows], query))
+        if not row_parts:
+            return np.zeros(0, np.int64), np.zeros(0, np.float32)
+        return np.concatenate(row_parts), np.concatenate(score_parts)
+
+    def _top(
+        self, rows: np.ndarray, scores: np.ndarray, k: int
+    ) -> List[Tuple[int, float]]:
+        if self.count > len(self._rows):
+            alive = self._deleted.data[rows] == 0
+            rows, scores = rows[alive], scores[alive]
+        if len(rows) > k:
+            keep = np.argpartition(-scores, k - 1)[:k]
+            rows, scores = rows[keep], scores[keep]
+        order = np.argsort(-scores, kind="stable")
+        return list(zip(rows[order].tolist(), scores[order].tolist()))
+
+    def search_rows(
+        self, query: np.ndarray, k: int, nprobe: int | None = None, exact: bool = False
+    ) -> List[Tuple[int, float]]:
+        """Best `k` rows for `query`.
+
+        Args:
+            query (np.ndarray): 1-D float vector of length `dim`.
+            k (int): Rows to return.
+            nprobe (int | None): Lists to scan, default=None for `self.nprobe`.
+            exact (bool): Scan every row instead, default=False.
+
+        Returns:
+            List[Tuple[int, float]]: `(row, score)` pairs, best first. A
+            rebuild renumbers rows, so resolve them while holding the index
+            lock or use `search_ids`.
+        """
+        self.refresh()
+        if k <= 0 or not self._rows:
+            return []
+        query = self._prepare(np.asarray(query, dtype=np.float32)[None, :])[0]
+        with self._lock:
+            if exact:
+                rows = np.arange(self.count)
+                scores = self._score(
+                    self._vectors.data[: self.count],
+                    self._norms.data[: self.count],
+                    query,
+                )
+            else:
+                rows, scores = self._candidates(query, nprobe or self.nprobe)
+            hits = self._top(rows, scores, k)
+        if self.metric == DistanceMetric.L2:
+            offset = float(query @ query)
+            hits = [(row, score - offset) for row, score in hits]
+        return hits
+
+    def search_rows_many(
+        self, queries: np.ndarray, k: int, nprobe: int | None = None
+    ) -> List[List[Tuple[int, float]]]:
+        """`search_rows` for a batch of queries with shared matrix products.
+
+        Centroids are scored for every query in one product. Each probed
+        list is then scanned once for all the queries that probe it, as one
+        (rows x queries) product; an untrained index scores the whole batch
+        against every row at once.
+
+        Args:
+            queries (np.ndarray): Float matrix of shape (n, dim).
+            k (int): Rows per query.
+            nprobe (int | None): Lists to scan, default=None for `self.nprobe`.
+
+        Returns:
+            List[List[Tuple[int, float]]]: Hits per query, best first.
+        """
+        queries = np.asarray(queries, dtype=np.float32).reshape(-1, self.dim)
+        self.refresh()
+        if k <= 0 or not self._rows or not len(queries):
+            return [[] for _ in range(len(queries))]
+        if len(queries) == 1:
+            return [self.search_rows(queries[0], k, nprobe)]
+        queries = self._prepare(queries)
+        nprobe = nprobe or self.nprobe
+        with self._lock:
+            vectors = np.asarray(self._vectors.data)
+            norms = np.asarray(self._norms.data)
+            if self._centroids is None:
+                rows = np.arange(self.count)
+                scores = self._score(
+                    vectors[: self.count], norms[: self.count], queries.T
+                )
+                hits = [self._top(rows, scores[:, i], k) for i in range(len(queries))]
+            else:
+                nprobe = min(nprobe, self.nlist)
+                probes = np.argpartition(
+                    -self._centroid_scores(queries), nprobe - 1, axis=1
+                )[:, :nprobe]
+                row_parts: List[List[np.ndarray]] = [[] for _ in range(len(queries))]
+                score_parts: List[List[np.ndarray]] = [[] for _ in range(len(queries))]
+                by_list = np.argsort(probes, axis=None, kind="stable")
+                probed = probes.ravel()[by_list]
+                bounds = np.flatnonzero(np.diff(probed)) + 1
+                starts = np.concatenate(([0], bounds)).tolist()
+                groups = np.split(by_list // nprobe, bounds)
+                for start, group in zip(starts, groups):
+                    # Every query in `group` probes list `probed[start]`.
+                    list_id = int(probed[start])
+                    lo = int(self._offsets[list_id])
+                    hi = int(self._offsets[list_id + 1])
+                    rows = np.arange(lo, hi)
+                    block = vectors[lo:hi]
+                    tail = self._tails.get(list_id)
+                    if tail:
+                        rows = np.concatenate((rows, tail))
+                        block = vectors[rows]
+                    if not len(rows):
+                        continue
+                    scores = self._score(block, norms[rows], queries[group].T)
+                    for column, query_id in enumerate(group.tolist()):
+                        row_parts[query_id].append(rows)
+                        score_parts[query_id].append(scores[:, column])
+                hits = [
+                    (self._top(np.concatenate(r), np.concatenate(sc), k) if r else [])
+                    for r, sc in zip(row_parts, score_parts)
+                ]
+        if self.metric == DistanceMetric.L2:
+            offsets = np.einsum("ij,ij->i", queries, queries).tolist()
+            hits = [
+                [(row, score - offset) for row, score in query_hits]
+                for query_hits, offset in zip(hits, offsets)
+            ]
+        return hits
+
+    def _read(self, row: int) -> str:
+        lo, hi = self._spans.data[row].tolist()
+        return os.pread(self._texts_fd, hi - lo, lo).decode("utf-8")
+
+    def document(self, row: int) -> str:
+        """Text stored with `row`.
+
+        Args:
+            row (int): Row from `search_rows`.
+
+        Returns:
+            str: The document.
+        """
+        with self._lock:
+            return self._read(row)
+
+    def documents(self, ids: Sequence[str]) -> List[str | None]:
+        """Texts stored under `ids`.
+
+        Args:
+            ids (Sequence[str]): Document ids.
+
+        Returns:
+            List[str | None]: The document per id, None when absent or
+            deleted.
+        """
+        self.refresh()
+        with self._lock:
+            rows = [self._rows.get(doc_id) for doc_id in ids]
+            return [None if row is None else self._read(row) for row in rows]
+
+    def items(self) -> Iterator[Tuple[str, str]]:
+        """Yield `(id, document)` for every live row, in row order.
+
+        Ids written or deleted during the iteration may be missed.
+        """
+        with self._lock:
+            ids = [self._ids[row] for row in sorted(self._rows.values())]
+        for start in range(0, len(ids), _ASSIGN_BLOCK_ROWS):
+            batch = ids[start : start + _ASSIGN_BLOCK_ROWS]
+            for doc_id, document in zip(batch, self.documents(batch)):
+                if document is not None:
+                    yield doc_id, document
+
+    def search_ids(
+        self, query: np.ndarray, k: int, nprobe: int | None = None
+    ) -> List[Tuple[str, float]]:
+        """`search_rows` with rows resolved to document ids.
+
+        Args:
+            query (np.ndarray): 1-D float vector of length `dim`.
+            k (int): Ids to return.
+            nprobe (int | None): Lists to scan, default=None for `self.nprobe`.
+
+        Returns:
+            List[Tuple[str, float]]: `(id, score)` pairs, best first.
+        """
+        with self._lock:
+            return [
+                (self._ids[row], score)
+                for row, score in self.search_rows(query, k, nprobe)
+            ]
+
+    def search_ids_many(
+        self, queries: np.ndarray, k: int, nprobe: int | None = None
+    ) -> List[List[Tuple[str, float]]]:
+        """`search_rows_many` with rows resolved to document ids.
+
+        Args:
+            queries (np.ndarray): Float matrix of shape (n, dim).
+            k (int): Ids per query.
+            nprobe (int | None): Lists to scan, default=None for `self.nprobe`.
+
+        Returns:
+            List[List[Tuple[str, float]]]: `(id, score)` pairs per query,
+            best first.
+        """
+        with self._lock:
+            return [
+                [(self._ids[row], score) for row, score in hits]
+                for hits in self.search_rows_many(queries, k, nprobe)
+            ]
+
+    def search(
+        self, query: np.ndarray, k: int, nprobe: int | None = None
+    ) -> List[Dict[str, Any]]:
+        """Best `k` documents for `query`.
+
+        Args:
+            query (np.ndarray): 1-D float vector of length `dim`.
+            k (int): Documents to return.
+            nprobe (int | None): Lists to scan, default=None for `self.nprobe`.
+
+        Returns:
+            List[Dict[str, Any]]: Hits with `id`, `document` and `score`.
+        """
+        with self._lock:
+            return self.search_many(np.asarray(query)[None, :], k, nprobe)[0]
+
+    def search_many(
+        self, queries: np.ndarray, k: int, nprobe: int | None = None
+    ) -> List[List[Dict[str, Any]]]:
+        """`search` for a batch of queries; see `search_rows_many`.
+
+        Args:
+            queries (np.ndarray): Float matrix of shape (n, dim).
+            k (int): Documents per query.
+            nprobe (int | None): Lists to scan, default=None for `self.nprobe`.
+
+        Returns:
+            List[List[Dict[str, Any]]]: Hits per query, each with `id`,
+            `document` and `score`.
+        """
+        # Rows are resolved under the lock a rebuild takes to renumber them.
+        with self._lock:
+            return [
+                [
+                    {"id": self._ids[row], "document": self._read(row), "score": score}
+                    for row, score in query_hits
+                ]
+                for query_hits in self.search_rows_many(queries, k, nprobe)
+            ]
+
+    def stats(self) -> Dict[str, Any]:
+        """Size and layout of the index.
+
+        Returns:
+            Dict[str, Any]: Live and stored rows, lists, tail rows and bytes.
+        """
+        return {
+            "metric": str(self.metric),
+            "live": len(self._rows),
+            "rows": self.count,
+            "nlist": self.nlist,
+            "nprobe": self.nprobe,
+            "tail_rows": self.count - self.built if self.nlist else self.count,
+            "vector_bytes": self.count * self.dim * 4,
+        }
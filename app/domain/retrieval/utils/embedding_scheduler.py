@@ -0,0 +1,208 @@
+"""Module documentation for `app/domain/retrieval/utils/embedding_scheduler.py`.
+
+This module is part of an enterprise-grade, research-ready codebase.
+Docstrings follow the Google Python style guide for consistency and clarity.
+
+Generated on 2025-08-16.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Sequence
+
+import numpy as np
+
+from app.common.utils.logger import setup_logger
+from app.common.utils.metrics import histogram
+
+logger = setup_logger()
+
+
+@dataclass
+class _EncodeRequest:
+    texts: Sequence[str]
+    future: Future = field(default_factory=Future)
+    enqueued: float = field(default_factory=time.perf_counter)
+
+
+def approx_token_length(text: str) -> int:
+    """Cheap token-count estimate used to bucket texts by padded length.
+
+    Args:
+        text (str): Input text.
+
+    Returns:
+        int: Whitespace-delimited word count.
+    """
+    return len(text.split())
+
+
+class EmbeddingScheduler:
+    """Coalesces concurrent encode requests into shared model calls.
+
+    A single background thread drains the request queue. It waits up to
+    `max_wait_ms` after the oldest pending request for more to arrive, or
+    until `max_batch_size` texts are pending. The deduplicated texts are
+    sorted by approximate token length and encoded in buckets of
+    `bucket_size`, so each forward pass pads to a similar length. Results
+    are routed back to each caller's future.
+    """
+
+    def __init__(
+        self,
+        encode_fn: Callable[[List[str]], np.ndarray],
+        max_batch_size: int,
+        max_wait_ms: float,
+        bucket_size: int,
+        length_fn: Callable[[str], int] = approx_token_length,
+    ) -> None:
+        """Initialize the scheduler; the worker thread starts on first submit.
+
+        Args:
+            encode_fn (Callable[[List[str]], np.ndarray]): Embeds a list of texts.
+            max_batch_size (int): Texts that trigger an immediate flush.
+            max_wait_ms (float): Longest a request waits for others to join.
+            bucket_size (int): Texts per forward pass within a flush.
+            length_fn (Callable[[str], int]): Length used for bucketing.
+        """
+        self.encode_fn = encode_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000
+        self.bucket_size = bucket_size
+        self.length_fn = length_fn
+        self._cond = threading.Condition()
+        self._queue: deque[_EncodeRequest] = deque()
+        self._pending_texts = 0
+        self._thread: threading.Thread | None = None
+        self._pid = os.getpid()
+        self._batch_size = histogram("embedding_scheduler.batch_size")
+        self._requests = histogram("embedding_scheduler.requests_per_batch")
+        self._wait_ms = histogram("embedding_scheduler.wait_ms")
+
+    def submit(self, texts: Sequence[str]) -> Future:
+        """Queue texts for the next batch.
+
+        Args:
+            texts (Sequence[str]): Texts to embed.
+
+        Returns:
+            Future: Resolves to a float32 matrix aligned with `texts`.
+        """
+        request = _EncodeRequest(list(texts))
+        if self._pid != os.getpid():
+            # The worker thread does not survive fork; start over in the child.
+            self._cond = threading.Condition()
+            self._queue.clear()
+            self._pending_texts = 0
+            self._thread = None
+            self._pid = os.getpid()
+        with self._cond:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="embedding-scheduler", daemon=True
+                )
+                self._thread.start()
+            self._queue.append(request)
+            self._pending_texts += len(request.texts)
+            self._cond.notify()
+        return request.future
+
+    def encode(self, texts: Sequence[str]) -> np.ndarray:
+        """Embed texts, blocking until their batch has run.
+
+        Args:
+            texts (Sequence[str]): Texts to embed.
+
+        Returns:
+            np.ndarray: Float32 matrix aligned with `texts`.
+        """
+        return self.submit(texts).result()
+
+    async def encode_async(self, texts: Sequence[str]) -> np.ndarray:
+        """Embed texts without blocking the event loop.
+
+        Args:
+            texts (Sequence[str]): Texts to embed.
+
+        Returns:
+            np.ndarray: Float32 matrix aligned with `texts`.
+        """
+        return await asyncio.wrap_future(self.submit(texts))
+
+    def _next_batch(self) -> List[_EncodeRequest]:
+        with self._cond:
+            while not self._queue:
+                self._cond.wait()
+            deadline = self._queue[0].enqueued + self.max_wait
+            while self._pending_texts < self.max_batch_size:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    break
+                self._cond.wait(remaining)
+            batch: List[_EncodeRequest] = []
+            taken = 0
+            while self._queue and (not batch or taken < self.max_batch_size):
+                request = self._queue.popleft()
+                taken += len(request.texts)
+                # Drops requests whose caller already gave up (e.g. a
+                # cancelled `encode_async`); the rest can no longer be
+                # cancelled.
+                if request.future.set_running_or_notify_cancel():
+                    batch.append(request)
+            self._pending_texts -= taken
+            return batch
+
+    @staticmethod
+    def _deliver(future: Future, result: np.ndarray | BaseException) -> None:
+        try:
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
+        except Exception as exc:
+            logger.error("Embedding result not delivered", error=str(exc))
+
+    def _run(self) -> None:
+        while True:
+            batch = self._next_batch()
+            if not batch:
+                continue
+            flushed = time.perf_counter()
+            for request in batch:
+                self._wait_ms.observe((flushed - request.enqueued) * 1000)
+            try:
+                vectors = self._encode_bucketed(
+                    list(dict.fromkeys(t for r in batch for t in r.texts))
+                )
+            except Exception as exc:
+                logger.error("Embedding batch failed", error=str(exc))
+                for request in batch:
+                    self._deliver(request.future, exc)
+                continue
+            self._requests.observe(len(batch))
+            self._batch_size.observe(len(vectors))
+            for request in batch:
+                self._deliver(
+                    request.future,
+                    (
+                        np.stack([vectors[t] for t in request.texts])
+                        if request.texts
+                        else np.zeros((0, 0), dtype=np.float32)
+                    ),
+                )
+
+    def _encode_bucketed(self, texts: List[str]) -> Dict[str, np.ndarray]:
+        ordered = sorted(texts, key=self.length_fn)
+        out: Dict[str, np.ndarray] = {}
+        for i in range(0, len(ordered), self.bucket_size):
+            bucket = ordered[i : i + self.bucket_size]
+            vectors = np.asarray(self.encode_fn(bucket), dtype=np.float32)
+            out.update(zip(bucket, vectors))
+        return out
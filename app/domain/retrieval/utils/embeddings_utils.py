@@ -8,35 +8,203 @@ Generated on 2025-08-15.
 
 from __future__ import annotations
 
-from functools import lru_cache
-from typing import List
+import asyncio
+import os
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Sequence
 
-from sentence_transformers import SentenceTransformer
+import numpy as np
 
 from app.common.decorators.errors import error_boundary
-from app.config import config
+from app.common.utils.metrics import histogram, register_collector
+from app.config import config, on_config_change
 from app.constants.errors import GET_CACHED_EMBEDDING
+from app.constants.values import (
+    EMBEDDING_CACHE_DIR,
+    EMBEDDING_CACHE_ENABLED,
+    EMBEDDING_CACHE_MAX_MB,
+    EMBED_BATCH_MAX_SIZE,
+    EMBED_BATCH_MAX_WAIT_MS,
+    EMBED_BUCKET_SIZE,
+    EMBED_SCHEDULER_ENABLED,
+    EMBED_VECTOR_DTYPE,
+)
+from app.domain.retrieval.base.embedding_backend_base import EmbeddingBackendBase
+from app.domain.retrieval.impl.embedding_backend_impl import (
+    create_embedding_backend,
+    embedding_cache_id,
+)
+from app.domain.retrieval.utils.embedding_scheduler import EmbeddingScheduler
+from app.domain.retrieval.utils.embedding_store import EmbeddingStore
+from app.domain.retrieval.utils.vector_utils import (
+    CompactVectors,
+    normalize_rows,
+    truncate_dim,
+)
 
-_model: SentenceTransformer | None = None
+_model: EmbeddingBackendBase | None = None
+_store: EmbeddingStore | None = None
+_scheduler: EmbeddingScheduler | None = None
+_model_lock = threading.Lock()
+_scheduler_lock = threading.Lock()
 
 
-def get_embedding_model() -> SentenceTransformer:
-    """Summary of `get_embedding_model`.
+def get_embedding_model() -> EmbeddingBackendBase:
+    """Return the process-wide embedding backend.
+
+    The backend is chosen by `retrieval.embeddings.provider` and runs on
+    `retrieval.embeddings.device` with `intra_op_threads` threads.
+
+    Returns:
+        EmbeddingBackendBase: Loaded backend.
+    """
+    global _model
+    model = _model
+    if model is None:
+        with _model_lock:
+            if _model is None:
+                cfg = config.retrieval.embeddings
+                _model = create_embedding_backend(
+                    cfg.provider, cfg.model, cfg.device, cfg.intra_op_threads
+                )
+            # Read under the lock: a config change may reset `_model` after.
+            model = _model
+    return model
+
+
+def embedding_dim() -> int:
+    """Dimension of the vectors this process produces.
+
+    Returns:
+        int: `retrieval.embeddings.truncate_dim` when set, else `dim`.
+    """
+    cfg = config.retrieval.embeddings
+    return cfg.truncate_dim or cfg.dim
+
+
+def get_embedding_store() -> EmbeddingStore | None:
+    """Return the shared on-disk embedding cache for the configured model.
+
+    Returns:
+        EmbeddingStore | None: The store, or None when disabled via
+        `EMBEDDING_CACHE_ENABLED`.
+    """
+    global _store
+    if _store is None and EMBEDDING_CACHE_ENABLED:
+        _store = EmbeddingStore(
+            directory=EMBEDDING_CACHE_DIR
+            or os.path.join(config.paths.vector_store_dir, "embedding_cache"),
+            model_name=embedding_cache_id(
+                config.retrieval.embeddings.provider, config.retrieval.embeddings.model
+            ),
+            dim=embedding_dim(),
+            max_bytes=EMBEDDING_CACHE_MAX_MB * 1024 * 1024,
+            dtype=EMBED_VECTOR_DTYPE,
+        )
+        register_collector("embedding_cache", _store.stats)
+    return _store
+
+
+def _on_embeddings_changed(old: Any, new: Any) -> None:
+    """Drop the backend and cache bound to the old model, dim or directory.
+
+    In-flight encodes finish on the objects they already hold; the next call
+    loads the new backend. The scheduler resolves the model per batch and
+    is kept.
+    """
+    global _model, _store
+    _model = None
+    _store = None
+
+
+on_config_change("retrieval.embeddings", _on_embeddings_changed)
+on_config_change("paths.vector_store_dir", _on_embeddings_changed)
+
+
+def _encode_model(texts: List[str]) -> np.ndarray:
+    started = time.perf_counter()
+    vectors = truncate_dim(
+        get_embedding_model().encode(texts, batch_size=len(texts)),
+        config.retrieval.embeddings.truncate_dim,
+    )
+    histogram("embedding.encode_ms").observe((time.perf_counter() - started) * 1000)
+    histogram("embedding.batch_size").observe(len(texts))
+    return vectors
+
+
+def get_embedding_scheduler() -> EmbeddingScheduler:
+    """Return the process-wide micro-batching scheduler for the embedding model.
+
+    Returns:
+        EmbeddingScheduler: Shared scheduler.
+    """
+    global _scheduler
+    if _scheduler is None:
+        with _scheduler_lock:
+            if _scheduler is None:
+                _scheduler = EmbeddingScheduler(
+                    _encode_model,
+                    max_batch_size=EMBED_BATCH_MAX_SIZE,
+                    max_wait_ms=EMBED_BATCH_MAX_WAIT_MS,
+                    bucket_size=EMBED_BUCKET_SIZE,
+                )
+    return _scheduler
+
+
+def encode_texts(texts: List[str]) -> np.ndarray:
+    """Run the embedding model, through the scheduler unless disabled.
 
     Args:
-        (no arguments)
+        texts (List[str]): Texts to embed.
 
     Returns:
-        SentenceTransformer: Description of return value.
+        np.ndarray: Raw float32 matrix aligned with `texts`.
+    """
+    if EMBED_SCHEDULER_ENABLED:
+        return get_embedding_scheduler().encode(texts)
+    return np.asarray(_encode_model(texts), dtype=np.float32)
+
 
+async def encode_texts_async(texts: List[str]) -> np.ndarray:
+    """Async variant of `encode_texts` that never blocks the event loop.
+
+    Args:
+        texts (List[str]): Texts to embed.
+
+    Returns:
+        np.ndarray: Raw float32 matrix aligned with `texts`.
     """
-    global _model
-    if _model is None:
-        _model = SentenceTransformer(config.retrieval.embeddings_model)
-    return _model
+    if EMBED_SCHEDULER_ENABLED:
+        return await get_embedding_scheduler().encode_async(texts)
+    return await asyncio.to_thread(encode_texts, texts)
+
+
+def encode_cached(texts: Sequence[str]) -> np.ndarray:
+    """Embed texts, serving repeats from the shared embedding cache.
+
+    Cache misses are encoded together and written back; concurrent callers'
+    misses share model calls via the embedding scheduler.
+
+    Args:
+        texts (Sequence[str]): Texts to embed.
+
+    Returns:
+        np.ndarray: Raw (unnormalized) float32 matrix aligned with `texts`.
+    """
+    store = get_embedding_store()
+    cached = store.get_many(texts) if store else {}
+    missing = list(dict.fromkeys(t for t in texts if t not in cached))
+    if missing:
+        vectors = encode_texts(missing)
+        if store and vectors.shape[1] == store.dim:
+            store.put_many(missing, vectors)
+        cached.update(zip(missing, vectors))
+    return (
+        np.stack([cached[t] for t in texts]) if texts else np.zeros((0, 0), np.float32)
+    )
 
 
-@lru_cache(maxsize=2048)
 @error_boundary(default_return={"error": GET_CACHED_EMBEDDING})
 def get_cached_embedding(text: str) -> List[float]:
     """Summary of `get_cached_embedding`.
@@ -48,4 +216,125 @@ def get_cached_embedding(text: str) -> List[float]:
         List[float]: Description of return value.
 
     """
-    return get_embedding_model().encode([text])[0].tolist()
+    return encode_cached([text])[0].tolist()
+
+
+class EmbeddingPlan:
+    """Deduplicated set of texts encoded together in a single batched pass.
+
+    Callers register every text they need with `add`, then read cosine
+    similarities back from one L2-normalized embedding matrix, kept in the
+    `EMBED_VECTOR_DTYPE` representation so scores match whether a vector came
+    from the model or the compact cache. Texts added after the first encode
+    are embedded in one extra batch on next access.
+    """
+
+    def __init__(self, texts: Iterable[str] = ()) -> None:
+        """Initialize the plan.
+
+        Args:
+            texts (Iterable[str]): Texts to register up front, default=().
+        """
+        self._rows: Dict[str, int] = {}
+        self._texts: List[str] = []
+        self._matrix: CompactVectors | None = None
+        self.add_all(texts)
+
+    def __len__(self) -> int:
+        """Return the number of unique texts in the plan."""
+        return len(self._texts)
+
+    def add(self, text: str) -> int:
+        """Register a text and return its row in the embedding matrix.
+
+        Args:
+            text (str): Text to embed.
+
+        Returns:
+            int: Row index of the text; duplicates share one row.
+        """
+        row = self._rows.get(text)
+        if row is None:
+            row = self._rows[text] = len(self._texts)
+            self._texts.append(text)
+        return row
+
+    def add_all(self, texts: Iterable[str]) -> None:
+        """Register several texts at once.
+
+        Args:
+            texts (Iterable[str]): Texts to embed.
+        """
+        for text in texts:
+            self.add(text)
+
+    def encode(self) -> CompactVectors:
+        """Embed every pending text, batching cache misses into one model call.
+
+        Returns:
+            CompactVectors: Normalized vectors with one row per unique text.
+        """
+        done = 0 if self._matrix is None else len(self._matrix)
+        if done < len(self._texts):
+            vectors = CompactVectors.from_float(
+                normalize_rows(encode_cached(self._texts[done:])), EMBED_VECTOR_DTYPE
+            )
+            self._matrix = (
+                vectors if self._matrix is None else self._matrix.append(vectors)
+            )
+        return self._matrix
+
+    def vector(self, text: str) -> np.ndarray:
+        """Return the normalized embedding of a registered text.
+
+        Args:
+            text (str): A text previously passed to `add`.
+
+        Returns:
+            np.ndarray: 1-D float32 vector.
+        """
+        return self.encode().take([self._rows[text]]).to_float()[0]
+
+    def similarities(self, text: str, others: List[str]) -> np.ndarray:
+        """Cosine similarity of one text against many, as one matrix product.
+
+        Args:
+            text (str): Registered query text.
+            others (List[str]): Registered texts to compare against.
+
+        Returns:
+            np.ndarray: Similarities aligned with `others`.
+        """
+        matrix = self.encode()
+        if not others:
+            return np.zeros(0, dtype=np.float32)
+        return matrix.take([self._rows[o] for o in others]).dot(self.vector(text))
+
+    def similarity_matrix(self, texts: List[str], others: List[str]) -> np.ndarray:
+        """Cosine similarity of every text against every other, in one product.
+
+        Args:
+            texts (List[str]): Registered texts, one row each.
+            others (List[str]): Registered texts, one column each.
+
+        Returns:
+            np.ndarray: Float32 matrix of shape (len(texts), len(others)).
+        """
+        matrix = self.encode()
+        if not texts or not others:
+            return np.zeros((len(texts), len(others)), dtype=np.float32)
+        rows = matrix.take([self._rows[t] for t in texts]).to_float()
+        cols = matrix.take([self._rows[o] for o in others]).to_float()
+        return rows @ cols.T
+
+    def similarity(self, a: str, b: str) -> float:
+        """Cosine similarity between two registered texts.
+
+        Args:
+            a (str): First text.
+            b (str): Second text.
+
+        Returns:
+            float: Cosine similarity.
+        """
+        return float(self.similarities(a, [b])[0])
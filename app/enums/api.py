@@ -23,6 +23,11 @@ class ResponseKey(StrEnum):
     RESPONSE = "response"
     PROMPT = "prompt"
     STREAM = "stream"
+    RESULTS = "results"
+    INDEX = "index"
+    RESULT = "result"
+    RESPONSE_ID = "response_id"
+    LINE = "line"
 
 
 class HTTPStatusCode(IntEnum):
@@ -20,6 +20,7 @@ class ScoreKey(StrEnum):
 
     HELPFULNESS = "eval.helpfulness"
     GROUNDING = "eval.grounding_score"
+    GROUNDING_SENTENCES = "eval.grounding_sentences"
     HALLUCINATION = "eval.hallucination_risk"
     RATING = "eval.rating"
 
@@ -10,3 +10,21 @@ class DistanceMetric(StrEnum):
     COSINE = "cosine"
     L2 = "l2"
     INNER = "inner"
+
+
+class RetrievalBackend(StrEnum):
+    POSTGRES = "postgres"
+    MEMORY = "memory"
+    HYBRID = "hybrid"
+
+
+class EmbeddingProvider(StrEnum):
+    SENTENCE_TRANSFORMERS = "sentence-transformers"
+    ONNX = "onnx"
+    TORCH_INT8 = "torch-int8"
+
+
+class VectorDtype(StrEnum):
+    FLOAT32 = "float32"
+    FLOAT16 = "float16"
+    INT8 = "int8"
@@ -8,34 +8,180 @@ Generated on 2025-08-16.
 
 from __future__ import annotations
 
+import json
 import os
+import tempfile
+import time
+from dataclasses import dataclass
+from pathlib import Path
 from typing import Any, Dict, List
 
 import httpx
 
-from app.constants.values import APP_CONFIG_NAME, APP_CONFIG_PROFILE, CONFIG_SERVICE_URL, CONFIG_TIMEOUT_SEC
+from app.common.utils.encoding import sha256
+from app.common.utils.logger import setup_logger
+from app.constants.values import APP_CONFIG_NAME, APP_CONFIG_PROFILE, CONFIG_LOCAL_PATH, CONFIG_SERVICE_URL, CONFIG_SNAPSHOT_PATH, CONFIG_TIMEOUT_SEC, ENCODING
 from app.integrations.config.config_schema import ConfigRequest
 
+logger = setup_logger()
+
+
+@dataclass
+class ConfigPayload:
+    """A Spring Config Server response and the identifiers used to detect change.
+
+    Attributes:
+        payload: Raw response with `propertySources`.
+        etag: `ETag` response header, if the server sent one.
+        version: Spring `version` field (the backing git revision), if any.
+        digest: sha256 of the canonical payload JSON.
+        source: `remote`, `snapshot` or `local`.
+        fetched_at: Unix time the payload was fetched from the server.
+    """
+
+    payload: Dict[str, Any]
+    etag: str | None = None
+    version: str | None = None
+    digest: str = ""
+    source: str = "remote"
+    fetched_at: float = 0.0
+
+    def __post_init__(self) -> None:
+        if not self.digest:
+            self.digest = sha256(json.dumps(self.payload, sort_keys=True))
+        if self.version is None and self.payload.get("version"):
+            self.version = str(self.payload["version"])
+
+    def same_as(self, other: ConfigPayload | None) -> bool:
+        """Whether `other` carries the same configuration."""
+        if other is None:
+            return False
+        if self.version and other.version and self.version != other.version:
+            return False
+        return self.digest == other.digest
+
 
 class ConfigIntegration:
     """Summary of `ConfigIntegration`."""
 
-    def __init__(self) -> None:
-        """Summary of `__init__`."""
+    def __init__(self, snapshot_path: str | None = CONFIG_SNAPSHOT_PATH) -> None:
+        """Summary of `__init__`.
+
+        Args:
+            snapshot_path (str | None): Where the last good payload is kept;
+                a file under the system temp directory when None.
+        """
         self.client = httpx.Client(timeout=CONFIG_TIMEOUT_SEC)
+        self.snapshot_path = Path(
+            snapshot_path
+            or os.path.join(tempfile.gettempdir(), "eval-config", f"{APP_CONFIG_NAME}-{APP_CONFIG_PROFILE}.json")
+        )
 
     def load(self) -> ConfigRequest:
         """Summary of `load`.
 
-        Try remote Spring Config Server first; fallback to local manifest.
+        Try remote Spring Config Server first; fallback to the last good
+        snapshot. A Spring-format payload at `CONFIG_LOCAL_PATH` replaces the
+        remote call entirely, for offline tools such as the benchmarks.
+
+        Raises:
+            httpx.HTTPError: The server is unreachable and no snapshot exists.
+        """
+        return self.build(self.load_payload())
+
+    def load_payload(self) -> ConfigPayload:
+        """Fetch the payload, falling back to the snapshot on failure.
+
+        Returns:
+            ConfigPayload: Local file, remote or snapshot payload.
+        """
+        if CONFIG_LOCAL_PATH:
+            with open(CONFIG_LOCAL_PATH, encoding=ENCODING) as fh:
+                return ConfigPayload(json.load(fh), source="local")
+        try:
+            fetched = self.fetch()
+            self.build(fetched)
+        except (httpx.HTTPError, ValueError) as exc:
+            snapshot = self.read_snapshot()
+            if snapshot is None:
+                raise
+            logger.warning("Config server unavailable, using snapshot", error=str(exc), version=snapshot.version)
+            return snapshot
+        self.write_snapshot(fetched)
+        return fetched
+
+    def fetch(self, current: ConfigPayload | None = None) -> ConfigPayload | None:
+        """GET the config from the server, conditionally on `current`.
+
+        Args:
+            current (ConfigPayload | None): Payload in use; its ETag is sent
+                as `If-None-Match`.
+
+        Returns:
+            ConfigPayload | None: The fetched payload, or None when the
+            server answered 304 or returned the same version and content.
+
+        Raises:
+            httpx.HTTPError: On connection errors or non-2xx responses.
         """
         url = f"{CONFIG_SERVICE_URL.rstrip('/')}/{APP_CONFIG_NAME}/{APP_CONFIG_PROFILE}"
-        resp = self.client.get(url)
+        headers = {"If-None-Match": current.etag} if current is not None and current.etag else {}
+        resp = self.client.get(url, headers=headers)
+        if resp.status_code == 304:
+            return None
         resp.raise_for_status()
-        payload = resp.json()
+        fetched = ConfigPayload(resp.json(), etag=resp.headers.get("etag"), fetched_at=time.time())
+        return None if fetched.same_as(current) else fetched
+
+    def read_snapshot(self) -> ConfigPayload | None:
+        """Load the last good payload written by `write_snapshot`.
+
+        Returns:
+            ConfigPayload | None: The snapshot, or None if missing or unreadable.
+        """
+        try:
+            with open(self.snapshot_path, encoding=ENCODING) as fh:
+                data = json.load(fh)
+            return ConfigPayload(
+                data["payload"],
+                etag=data.get("etag"),
+                version=data.get("version"),
+                source="snapshot",
+                fetched_at=float(data.get("fetched_at", 0.0)),
+            )
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
 
-        nested = self._merge_property_sources(payload)
-        python_dict = self._spring_to_python_schema(nested)
+    def write_snapshot(self, fetched: ConfigPayload) -> None:
+        """Persist a validated payload, atomically replacing the old one.
+
+        Args:
+            fetched (ConfigPayload): Payload that passed `build`.
+        """
+        try:
+            self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = self.snapshot_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp, "w", encoding=ENCODING) as fh:
+                json.dump(
+                    {"payload": fetched.payload, "etag": fetched.etag, "version": fetched.version, "fetched_at": fetched.fetched_at},
+                    fh,
+                )
+            os.replace(tmp, self.snapshot_path)
+        except (OSError, TypeError) as exc:
+            logger.warning("Config snapshot not written", path=str(self.snapshot_path), error=str(exc))
+
+    @classmethod
+    def build(cls, fetched: ConfigPayload) -> ConfigRequest:
+        """Merge and validate a payload.
+
+        Args:
+            fetched (ConfigPayload): Spring payload.
+
+        Returns:
+            ConfigRequest: Validated config.
+        """
+        nested = cls._merge_property_sources(fetched.payload)
+        python_dict = cls._spring_to_python_schema(nested)
         return ConfigRequest(**python_dict)
 
 
@@ -109,6 +255,8 @@ class ConfigIntegration:
                 "model": ret.get("embeddings", {}).get("model"),
                 "dim": int(ret.get("embeddings", {}).get("dim", 384)),
                 "device": ret.get("embeddings", {}).get("device"),
+                "intra_op_threads": ret.get("embeddings", {}).get("intraOpThreads"),
+                "truncate_dim": ret.get("embeddings", {}).get("truncateDim"),
             },
         }
 
@@ -49,6 +49,8 @@ class RetrievalEmbeddings(BaseModel):
     model: str
     dim: int
     device: Optional[str] = None
+    intra_op_threads: Optional[int] = None
+    truncate_dim: Optional[int] = None
 
 
 class RetrievalCfg(BaseModel):
@@ -7,11 +7,34 @@ Generated on 2025-08-15.
 """
 
 from __future__ import annotations
+
+import threading
 from typing import Any
 
+from app.common.utils.executor import BoundedExecutor
+from app.constants.values import EVAL_MAX_QUEUE, EVAL_MAX_WORKERS
 from app.domain.eval.impl.eval_impl import EvalImpl
 from app.enums.prompts import JsonKey
 
+_eval_executor: BoundedExecutor | None = None
+_eval_executor_lock = threading.Lock()
+
+
+def get_eval_executor() -> BoundedExecutor:
+    """Return the process-wide executor that runs blocking eval work.
+
+    Returns:
+        BoundedExecutor: Pool sized by `EVAL_MAX_WORKERS` and `EVAL_MAX_QUEUE`.
+    """
+    global _eval_executor
+    if _eval_executor is None:
+        with _eval_executor_lock:
+            if _eval_executor is None:
+                _eval_executor = BoundedExecutor(
+                    "eval_pool", EVAL_MAX_WORKERS, EVAL_MAX_QUEUE
+                )
+    return _eval_executor
+
 
 class EvalService:
     """Summary of `EvalService`.
@@ -43,6 +66,7 @@ class EvalService:
         rendered_prompt: str,
         raw_input: str,
         conversation_history: list[dict[str, Any]] | None = None,
+        sentence_scores: bool = False,
     ) -> Any:
         """Run evaluation with explicit arguments.
 
@@ -56,6 +80,7 @@ class EvalService:
             rendered_prompt (str): The fully rendered prompt sent to the model.
             raw_input (str): The raw user input text.
             conversation_history (list[dict[str, Any]] | None): Session conversation history.
+            sentence_scores (bool): Also return per-sentence groundedness.
 
         Returns:
             Any: The result returned by `EvalImpl.run`.
@@ -70,7 +95,19 @@ class EvalService:
             rendered_prompt=rendered_prompt,
             raw_input=raw_input,
             conversation_history=conversation_history,
+            sentence_scores=sentence_scores,
         )
 
+    def run_batch(self, items: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Run evaluation for many requests with one shared embedding pass.
+
+        Args:
+            items (list[dict[str, Any]]): Keyword arguments accepted by `run`.
+
+        Returns:
+            list[dict[str, Any]]: Results aligned with `items`.
+        """
+        return self.eval_impl.run_batch(items)
+
 
 Eval_service = EvalService()
@@ -0,0 +1,7 @@
+"""Module documentation for `benchmarks/__init__.py`.
+
+This module is part of an enterprise-grade, research-ready codebase.
+Docstrings follow the Google Python style guide for consistency and clarity.
+
+Generated on 2025-08-16.
+"""
@@ -0,0 +1,120 @@
+"""Module documentation for `benchmarks/fake_ollama.py`.
+
+This module is part of an enterprise-grade, research-ready codebase.
+Docstrings follow the Google Python style guide for consistency and clarity.
+
+Generated on 2025-08-16.
+
+Local stand-in for the Ollama `/api/generate` endpoint with a configurable
+latency distribution and error rate::
+
+    python -m benchmarks.fake_ollama --port 11435 --latency-ms 800 \\
+        --distribution lognormal --sigma 0.4 --error-rate 0.01
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import zlib
+from typing import List
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+
+class LatencyModel:
+    """Samples simulated generation latency in milliseconds."""
+
+    def __init__(
+        self,
+        median_ms: float,
+        distribution: str = "lognormal",
+        sigma: float = 0.4,
+        seed: int | None = None,
+    ) -> None:
+        """Initialize the model.
+
+        Args:
+            median_ms (float): Median latency.
+            distribution (str): `fixed`, `uniform` (0.5x-1.5x median) or
+                `lognormal`, default=`lognormal`.
+            sigma (float): Log-space standard deviation for `lognormal`.
+            seed (int | None): Random seed, default=None.
+        """
+        self.median_ms = median_ms
+        self.distribution = distribution
+        self.sigma = sigma
+        self.rng = random.Random(seed)
+
+    def sample(self) -> float:
+        """Draw one latency.
+
+        Returns:
+            float: Latency in milliseconds.
+        """
+        if self.distribution == "fixed":
+            return self.median_ms
+        if self.distribution == "uniform":
+            return self.rng.uniform(0.5, 1.5) * self.median_ms
+        return self.median_ms * self.rng.lognormvariate(0.0, self.sigma)
+
+
+def create_app(latency: LatencyModel, error_rate: float = 0.0) -> FastAPI:
+    """Build the fake Ollama application.
+
+    Args:
+        latency (LatencyModel): Per-request latency source.
+        error_rate (float): Fraction of requests answered with HTTP 500.
+
+    Returns:
+        FastAPI: App serving `POST /api/generate`.
+    """
+    app = FastAPI()
+
+    @app.post("/api/generate")
+    async def generate(request: Request):
+        body = await request.json()
+        await asyncio.sleep(latency.sample() / 1000)
+        if error_rate and latency.rng.random() < error_rate:
+            return JSONResponse({"error": "simulated failure"}, status_code=500)
+        score = zlib.crc32(body.get("prompt", "").encode()) % 5 + 1
+        return {
+            "model": body.get("model"),
+            "response": f"Score: {score}",
+            "done": True,
+        }
+
+    return app
+
+
+def main(argv: List[str] | None = None) -> None:
+    """CLI entry point.
+
+    Args:
+        argv (List[str] | None): Arguments, default=None for `sys.argv`.
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.fake_ollama")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=11435)
+    parser.add_argument("--latency-ms", type=float, default=800.0)
+    parser.add_argument(
+        "--distribution", choices=("fixed", "uniform", "lognormal"), default="lognormal"
+    )
+    parser.add_argument("--sigma", type=float, default=0.4)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args(argv)
+    latency = LatencyModel(args.latency_ms, args.distribution, args.sigma, args.seed)
+    uvicorn.run(
+        create_app(latency, args.error_rate),
+        host=args.host,
+        port=args.port,
+        log_level="warning",
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""Module documentation for `benchmarks/import_budget.py`.
+
+This module is part of an enterprise-grade, research-ready codebase.
+Docstrings follow the Google Python style guide for consistency and clarity.
+
+Generated on 2025-08-16.
+
+Import-time budget check for the service entry point::
+
+    python -m benchmarks.import_budget --budget-ms 1500
+
+Runs `python -X importtime -c "import main"` in fresh interpreters, takes
+the median cumulative time of `main`, and exits non-zero when it exceeds the
+budget or when a module that must stay lazy (the embedding runtimes, the
+tracing SDK, HTTP clients) was imported. The config server URL is pointed at
+a closed port, so an import-time config fetch fails the check as well.
+Prints the slowest modules by self time to show where a regression came
+from.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+
+DEFERRED = (
+    "sentence_transformers",
+    "torch",
+    "onnxruntime",
+    "opentelemetry.sdk",
+    "opentelemetry.exporter",
+    "httpx",
+)
+
+
+def parse_importtime(stderr: str) -> Dict[str, Tuple[int, int]]:
+    """Parse `-X importtime` output.
+
+    Args:
+        stderr (str): Interpreter stderr.
+
+    Returns:
+        Dict[str, Tuple[int, int]]: `(self_us, cumulative_us)` per module.
+    """
+    modules: Dict[str, Tuple[int, int]] = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|", 2)
+        modules[name.strip()] = (int(self_us), int(cumulative_us))
+    return modules
+
+
+def measure(module: str = "main") -> Dict[str, Tuple[int, int]]:
+    """Import `module` in a fresh interpreter with import timing on.
+
+    Args:
+        module (str): Module to import, default=`main`.
+
+    Returns:
+        Dict[str, Tuple[int, int]]: Parsed import times.
+
+    Raises:
+        RuntimeError: The import failed.
+    """
+    env = dict(os.environ)
+    env["CONFIG_SERVICE_URL"] = "http://127.0.0.1:9"
+    env.pop("CONFIG_LOCAL_PATH", None)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode:
+        raise RuntimeError(f"import {module} failed:\n{proc.stderr[-2000:]}")
+    return parse_importtime(proc.stderr)
+
+
+def check(budget_ms: float, runs: int = 5, module: str = "main", top: int = 15) -> int:
+    """Compare the median import time with the budget.
+
+    Args:
+        budget_ms (float): Maximum median cumulative import time.
+        runs (int): Fresh interpreters to sample, default=5.
+        module (str): Module to import, default=`main`.
+        top (int): Slowest modules to print, default=15.
+
+    Returns:
+        int: 0 within budget, 1 otherwise.
+    """
+    samples: List[Dict[str, Tuple[int, int]]] = [measure(module) for _ in range(runs)]
+    totals = [s[module][1] / 1000 for s in samples]
+    median_ms = statistics.median(totals)
+    last = samples[-1]
+    for name, (self_us, cumulative_us) in sorted(
+        last.items(), key=lambda item: -item[1][0]
+    )[:top]:
+        print(f"{self_us / 1000:8.1f} ms self {cumulative_us / 1000:8.1f} ms  {name}")
+    leaked = sorted(
+        name
+        for name in last
+        if any(name == d or name.startswith(d + ".") for d in DEFERRED)
+    )
+    print(
+        f"import {module}: median {median_ms:.1f} ms over {runs} runs "
+        f"(min {min(totals):.1f}, max {max(totals):.1f}), budget {budget_ms:.0f} ms"
+    )
+    failed = False
+    if leaked:
+        roots = sorted({name.split(".")[0] for name in leaked})
+        print(f"FAIL: deferred modules imported eagerly: {', '.join(roots)}")
+        failed = True
+    if median_ms > budget_ms:
+        print("FAIL: import time over budget")
+        failed = True
+    return 1 if failed else 0
+
+
+def main(argv: List[str] | None = None) -> int:
+    """CLI entry point.
+
+    Args:
+        argv (List[str] | None): Arguments, default=None for `sys.argv`.
+
+    Returns:
+        int: 0 within budget, 1 otherwise.
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.import_budget")
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=float(os.getenv("IMPORT_BUDGET_MS", "1500")),
+    )
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--module", default="main")
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args(argv)
+    return check(args.budget_ms, args.runs, args.module, args.top)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,392 @@
+"""Module documentation for `benchmarks/load_test.py`.
+
+This module is part of an enterprise-grade, research-ready codebase.
+Docstrings follow the Google Python style guide for consistency and clarity.
+
+Generated on 2025-08-16.
+
+End-to-end load generator for `POST /eval`::
+
+    # everything local: fake Ollama + stubbed app, open-loop RPS steps
+    python -m benchmarks.load_test --spawn --rps 5,10,20,40 --duration 20
+
+    # an already running app, closed-loop concurrency steps
+    python -m benchmarks.load_test --url http://127.0.0.1:8001 \\
+        --payloads evals.jsonl --concurrency 4,8,16,32
+
+Payloads are `EvalRequest` JSON lines (or synthetic ones when no file is
+given). Each level reports achieved throughput, the latency histogram and
+percentiles, the error rate and the eval pool's queueing from `/metrics`.
+The saturation point is the first level where throughput stops keeping up
+with offered load (open loop) or stops scaling (closed loop), errors
+exceed `--max-error-rate`, or p99 exceeds `--slo-ms`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import json
+import os
+import subprocess
+import sys
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Tuple
+
+import httpx
+
+from app.common.utils.metrics import percentile
+from benchmarks.eval_bench import Corpus
+
+BUCKETS_MS = (10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+
+
+def load_payloads(path: str | None, synthetic: int) -> List[Dict[str, Any]]:
+    """Read eval payloads from JSONL, or generate synthetic ones.
+
+    Args:
+        path (str | None): JSONL file of `EvalRequest` records.
+        synthetic (int): Payloads to generate when `path` is None.
+
+    Returns:
+        List[Dict[str, Any]]: Request bodies.
+    """
+    if path:
+        with open(path, encoding="utf-8") as fh:
+            return [json.loads(line) for line in fh if line.strip()]
+    corpus = Corpus()
+    payloads = []
+    for i in range(synthetic):
+        docs = [corpus.text(120) for _ in range(5)]
+        query = corpus.text(12, docs)
+        payloads.append(
+            {
+                "filtered_input": query,
+                "response": corpus.text(60, docs),
+                "retrieved_docs": docs,
+                "response_id": f"synthetic-{i}",
+                "message_id": f"m-{i}",
+                "session_id": f"s-{i % 50}",
+                "rendered_prompt": query,
+                "raw_input": query,
+            }
+        )
+    return payloads
+
+
+@dataclass
+class Level:
+    """Outcome of one load level."""
+
+    mode: str
+    level: float
+    wall_sec: float = 0.0
+    samples: List[Tuple[float, int]] = field(default_factory=list)
+    server: Dict[str, Any] = field(default_factory=dict)
+
+    def summary(self) -> Dict[str, Any]:
+        """Throughput, latency percentiles, histogram and error rate.
+
+        Returns:
+            Dict[str, Any]: JSON-serializable level report.
+        """
+        latencies = sorted(ms for ms, status in self.samples if status == 200)
+        errors = sum(status != 200 for _, status in self.samples)
+        statuses: Dict[str, int] = {}
+        for _, status in self.samples:
+            statuses[str(status)] = statuses.get(str(status), 0) + 1
+        histogram: Dict[str, int] = {}
+        for ms in latencies:
+            bucket = next((b for b in BUCKETS_MS if ms <= b), None)
+            key = f"<={bucket}" if bucket else f">{BUCKETS_MS[-1]}"
+            histogram[key] = histogram.get(key, 0) + 1
+        total = len(self.samples)
+        return {
+            "mode": self.mode,
+            "level": self.level,
+            "sent": total,
+            "achieved_rps": round(len(latencies) / self.wall_sec, 2),
+            "error_rate": round(errors / total, 4) if total else 0.0,
+            "statuses": statuses,
+            "p50_ms": round(percentile(latencies, 50), 1),
+            "p90_ms": round(percentile(latencies, 90), 1),
+            "p99_ms": round(percentile(latencies, 99), 1),
+            "max_ms": round(latencies[-1], 1) if latencies else 0.0,
+            "histogram_ms": histogram,
+            "server": self.server,
+        }
+
+
+async def _send(
+    client: httpx.AsyncClient, url: str, payload: Dict[str, Any]
+) -> Tuple[float, int]:
+    started = time.perf_counter()
+    try:
+        response = await client.post(url, json=payload)
+        status = response.status_code
+    except httpx.HTTPError:
+        status = 0
+    return (time.perf_counter() - started) * 1000, status
+
+
+def _payload_stream(payloads: List[Dict[str, Any]]):
+    for n, payload in enumerate(itertools.cycle(payloads)):
+        yield {**payload, "response_id": f"{payload.get('response_id')}-{n}"}
+
+
+async def open_loop(
+    client: httpx.AsyncClient,
+    url: str,
+    payloads: List[Dict[str, Any]],
+    rps: float,
+    duration: float,
+) -> Level:
+    """Send at a fixed arrival rate regardless of completions.
+
+    Args:
+        client (httpx.AsyncClient): HTTP client.
+        url (str): Eval endpoint.
+        payloads (List[Dict[str, Any]]): Bodies to cycle through.
+        rps (float): Target arrival rate.
+        duration (float): Seconds to keep sending.
+
+    Returns:
+        Level: Samples for this level.
+    """
+    loop = asyncio.get_running_loop()
+    level = Level("rps", rps)
+    tasks = []
+    started = loop.time()
+    for n, payload in enumerate(_payload_stream(payloads)):
+        due = started + n / rps
+        if due - started >= duration:
+            break
+        await asyncio.sleep(max(0.0, due - loop.time()))
+        tasks.append(asyncio.create_task(_send(client, url, payload)))
+    level.samples = list(await asyncio.gather(*tasks))
+    level.wall_sec = loop.time() - started
+    return level
+
+
+async def closed_loop(
+    client: httpx.AsyncClient,
+    url: str,
+    payloads: List[Dict[str, Any]],
+    concurrency: int,
+    duration: float,
+) -> Level:
+    """Keep `concurrency` requests in flight for `duration` seconds.
+
+    Args:
+        client (httpx.AsyncClient): HTTP client.
+        url (str): Eval endpoint.
+        payloads (List[Dict[str, Any]]): Bodies to cycle through.
+        concurrency (int): Concurrent clients.
+        duration (float): Seconds to keep sending.
+
+    Returns:
+        Level: Samples for this level.
+    """
+    loop = asyncio.get_running_loop()
+    level = Level("concurrency", concurrency)
+    stream = _payload_stream(payloads)
+    started = loop.time()
+
+    async def worker() -> None:
+        while loop.time() - started < duration:
+            level.samples.append(await _send(client, url, next(stream)))
+
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    level.wall_sec = loop.time() - started
+    return level
+
+
+async def _server_stats(client: httpx.AsyncClient, base_url: str) -> Dict[str, Any]:
+    try:
+        snapshot = (await client.get(f"{base_url}/metrics")).json()
+    except (httpx.HTTPError, ValueError):
+        return {}
+    pool = snapshot.get("eval_pool", {})
+    waits = snapshot.get("histograms", {}).get("eval_pool.queue_wait_ms", {})
+    return {
+        "rejected": pool.get("rejected"),
+        "completed": pool.get("completed"),
+        "queue_wait_p99_ms": waits.get("p99"),
+    }
+
+
+def find_saturation(
+    levels: List[Dict[str, Any]], max_error_rate: float, slo_ms: float | None
+) -> Dict[str, Any] | None:
+    """First level at which the service stopped keeping up.
+
+    Args:
+        levels (List[Dict[str, Any]]): Level summaries in ascending load.
+        max_error_rate (float): Highest acceptable error rate.
+        slo_ms (float | None): p99 latency objective.
+
+    Returns:
+        Dict[str, Any] | None: Level and reason, or None if never saturated.
+    """
+    previous = None
+    for level in levels:
+        reason = None
+        if level["error_rate"] > max_error_rate:
+            reason = f"error rate {level['error_rate']:.2%}"
+        elif slo_ms is not None and level["p99_ms"] > slo_ms:
+            reason = f"p99 {level['p99_ms']}ms over {slo_ms}ms SLO"
+        elif level["mode"] == "rps" and level["achieved_rps"] < 0.9 * level["level"]:
+            reason = f"achieved {level['achieved_rps']} of {level['level']} rps"
+        elif (
+            level["mode"] == "concurrency"
+            and previous is not None
+            and level["achieved_rps"] < 1.1 * previous["achieved_rps"]
+        ):
+            reason = "throughput stopped scaling with concurrency"
+        if reason:
+            return {"level": level["level"], "mode": level["mode"], "reason": reason}
+        previous = level
+    return None
+
+
+def _spawn(args: argparse.Namespace) -> List[subprocess.Popen]:
+    env = {
+        **os.environ,
+        "OLLAMA_BASE_URL": f"http://127.0.0.1:{args.ollama_port}",
+        "OLLAMA_USE_HTTP_API": "true",
+    }
+    fake = subprocess.Popen(
+        [
+            sys.executable,
+            "-m",
+            "benchmarks.fake_ollama",
+            "--port",
+            str(args.ollama_port),
+            "--latency-ms",
+            str(args.judge_latency_ms),
+            "--distribution",
+            args.judge_distribution,
+            "--error-rate",
+            str(args.judge_error_rate),
+        ],
+        env=env,
+    )
+    app = subprocess.Popen(
+        [sys.executable, "-m", "benchmarks.serve_stubbed", "--port", str(args.port)],
+        env=env,
+    )
+    deadline = time.time() + 120
+    while time.time() < deadline:
+        try:
+            httpx.get(f"http://127.0.0.1:{args.port}/metrics", timeout=1.0)
+            return [fake, app]
+        except httpx.HTTPError:
+            time.sleep(0.5)
+    for proc in (fake, app):
+        proc.terminate()
+    raise RuntimeError("Stubbed eval app did not become ready")
+
+
+async def run_levels(args: argparse.Namespace, base_url: str) -> Dict[str, Any]:
+    """Run every configured level against `base_url`.
+
+    Args:
+        args (argparse.Namespace): Parsed CLI arguments.
+        base_url (str): App root URL.
+
+    Returns:
+        Dict[str, Any]: Level summaries and the saturation point.
+    """
+    payloads = load_payloads(args.payloads, args.synthetic)
+    url = f"{base_url}/eval"
+    limits = httpx.Limits(max_connections=None, max_keepalive_connections=256)
+    summaries = []
+    async with httpx.AsyncClient(limits=limits, timeout=args.timeout) as client:
+        if args.rps:
+            plan = [("rps", float(v)) for v in args.rps.split(",")]
+        else:
+            plan = [("concurrency", int(v)) for v in args.concurrency.split(",")]
+        for mode, value in plan:
+            if mode == "rps":
+                level = await open_loop(client, url, payloads, value, args.duration)
+            else:
+                level = await closed_loop(client, url, payloads, value, args.duration)
+            level.server = await _server_stats(client, base_url)
+            summary = level.summary()
+            summaries.append(summary)
+            print(
+                f"{mode}={value:<8} sent {summary['sent']:>6} "
+                f"rps {summary['achieved_rps']:>8} err {summary['error_rate']:>7.2%} "
+                f"p50 {summary['p50_ms']:>8}ms p99 {summary['p99_ms']:>8}ms "
+                f"queue_wait_p99 {summary['server'].get('queue_wait_p99_ms')}ms",
+                flush=True,
+            )
+            if args.cooldown:
+                await asyncio.sleep(args.cooldown)
+    return {
+        "levels": summaries,
+        "saturation": find_saturation(summaries, args.max_error_rate, args.slo_ms),
+        "max_throughput_rps": max((s["achieved_rps"] for s in summaries), default=0),
+    }
+
+
+def main(argv: List[str] | None = None) -> int:
+    """CLI entry point.
+
+    Args:
+        argv (List[str] | None): Arguments, default=None for `sys.argv`.
+
+    Returns:
+        int: Process exit code.
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.load_test")
+    parser.add_argument("--url", default="http://127.0.0.1:8001")
+    parser.add_argument("--payloads", help="JSONL of EvalRequest bodies")
+    parser.add_argument("--synthetic", type=int, default=200)
+    load = parser.add_mutually_exclusive_group()
+    load.add_argument("--rps", help="comma-separated arrival rates, open loop")
+    load.add_argument(
+        "--concurrency",
+        default="1,2,4,8,16,32",
+        help="comma-separated client counts, closed loop",
+    )
+    parser.add_argument("--duration", type=float, default=15.0)
+    parser.add_argument("--cooldown", type=float, default=2.0)
+    parser.add_argument("--timeout", type=float, default=120.0)
+    parser.add_argument("--max-error-rate", type=float, default=0.01)
+    parser.add_argument("--slo-ms", type=float)
+    parser.add_argument("-o", "--output", help="write the report as JSON")
+    spawn = parser.add_argument_group("local stack")
+    spawn.add_argument(
+        "--spawn", action="store_true", help="start fake Ollama and a stubbed app"
+    )
+    spawn.add_argument("--port", type=int, default=8001)
+    spawn.add_argument("--ollama-port", type=int, default=11435)
+    spawn.add_argument("--judge-latency-ms", type=float, default=800.0)
+    spawn.add_argument(
+        "--judge-distribution",
+        choices=("fixed", "uniform", "lognormal"),
+        default="lognormal",
+    )
+    spawn.add_argument("--judge-error-rate", type=float, default=0.0)
+    args = parser.parse_args(argv)
+
+    procs = _spawn(args) if args.spawn else []
+    base_url = f"http://127.0.0.1:{args.port}" if args.spawn else args.url.rstrip("/")
+    try:
+        report = asyncio.run(run_levels(args, base_url))
+    finally:
+        for proc in procs:
+            proc.terminate()
+            proc.wait(timeout=10)
+    print(json.dumps({k: report[k] for k in ("saturation", "max_throughput_rps")}))
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump(report, fh, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
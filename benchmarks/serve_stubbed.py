@@ -0,0 +1,87 @@
+"""Module documentation for `benchmarks/serve_stubbed.py`.
+
+This module is part of an enterprise-grade, research-ready codebase.
+Docstrings follow the Google Python style guide for consistency and clarity.
+
+Generated on 2025-08-16.
+
+Serve the eval app offline for load tests: bundled config, stub embedder,
+and the judge pointed at whatever `OLLAMA_BASE_URL` names (normally
+`benchmarks.fake_ollama`)::
+
+    OLLAMA_BASE_URL=http://127.0.0.1:11435 python -m benchmarks.serve_stubbed
+
+With `--workers N` the app is served by `app.services.prefork_server`,
+preloading the embedder in the master unless `--no-preload` is given.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+from typing import List
+
+from benchmarks.stubs import StubEmbeddingModel, configure_offline_env
+
+
+def main(argv: List[str] | None = None) -> None:
+    """CLI entry point.
+
+    Args:
+        argv (List[str] | None): Arguments, default=None for `sys.argv`.
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.serve_stubbed")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8001)
+    parser.add_argument(
+        "--real-model",
+        action="store_true",
+        help="use the configured sentence-transformers model",
+    )
+    parser.add_argument(
+        "--stub-buckets",
+        type=int,
+        default=4096,
+        help="stub vocabulary size; sets the stub's weight size (buckets x dim x 4)",
+    )
+    parser.add_argument("-w", "--workers", type=int, default=0)
+    parser.add_argument("--no-preload", action="store_true")
+    args = parser.parse_args(argv)
+
+    # Measure the serving path: keep the embedding scheduler on.
+    os.environ.setdefault("EMBED_SCHEDULER_ENABLED", "true")
+    configure_offline_env()
+
+    def install_embedder() -> None:
+        from app.config import config
+        from app.domain.retrieval.utils import embeddings_utils
+
+        if not args.real_model:
+            embeddings_utils._model = StubEmbeddingModel(
+                config.retrieval.embeddings.dim, buckets=args.stub_buckets
+            )
+
+    if args.workers:
+        from app.services.prefork_server import serve
+
+        serve(
+            "main:app",
+            args.host,
+            args.port,
+            args.workers,
+            preload=not args.no_preload,
+            setup=install_embedder,
+            log_level="warning",
+        )
+        return
+
+    import uvicorn
+
+    import main as app_main
+
+    install_embedder()
+    uvicorn.run(app_main.app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
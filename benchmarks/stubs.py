@@ -0,0 +1,126 @@
+"""Module documentation for `benchmarks/stubs.py`.
+
+This module is part of an enterprise-grade, research-ready codebase.
+Docstrings follow the Google Python style guide for consistency and clarity.
+
+Generated on 2025-08-16.
+
+Deterministic stand-ins for the embedding model and the Ollama judge so the
+eval hot path can be measured offline and reproducibly.
+"""
+
+from __future__ import annotations
+
+import os
+import time
+import zlib
+from pathlib import Path
+from typing import Any, Sequence
+
+import numpy as np
+
+CONFIG_PAYLOAD = Path(__file__).with_name("config_payload.json")
+
+
+def configure_offline_env() -> None:
+    """Point the app at the bundled config and turn off cross-call caches.
+
+    Must run before anything under `app` is imported. Caches and the
+    embedding scheduler are disabled so every call does the full work;
+    explicit environment settings win.
+    """
+    os.environ.setdefault("CONFIG_LOCAL_PATH", str(CONFIG_PAYLOAD))
+    os.environ.setdefault("EMBEDDING_CACHE_ENABLED", "false")
+    os.environ.setdefault("JUDGE_CACHE_ENABLED", "false")
+    os.environ.setdefault("EMBED_SCHEDULER_ENABLED", "false")
+
+
+class StubEmbeddingModel:
+    """Bag-of-words embedder with a fixed random vector per hashed token.
+
+    Cost grows with token count and dimension like a real encoder's pooling
+    step, and equal texts always map to equal vectors.
+    """
+
+    def __init__(self, dim: int = 384, buckets: int = 4096, seed: int = 0) -> None:
+        """Initialize the token table.
+
+        Args:
+            dim (int): Embedding dimension, default=384.
+            buckets (int): Hashed vocabulary size, default=4096.
+            seed (int): Table seed, default=0.
+        """
+        self.dim = dim
+        self.buckets = buckets
+        self.table = np.random.default_rng(seed).standard_normal(
+            (buckets, dim), dtype=np.float32
+        )
+
+    def get_sentence_embedding_dimension(self) -> int:
+        """Return the embedding dimension."""
+        return self.dim
+
+    def freeze(self) -> None:
+        """Make the token table read-only, like frozen model weights."""
+        self.table.setflags(write=False)
+
+    def encode(self, texts: Sequence[str], **_: Any) -> np.ndarray:
+        """Embed texts as the mean of their token vectors.
+
+        Args:
+            texts (Sequence[str]): Texts to embed.
+
+        Returns:
+            np.ndarray: Float32 matrix of shape (len(texts), dim).
+        """
+        out = np.zeros((len(texts), self.dim), dtype=np.float32)
+        for i, text in enumerate(texts):
+            ids = [zlib.crc32(t.encode()) % self.buckets for t in text.lower().split()]
+            if ids:
+                out[i] = self.table[ids].mean(axis=0)
+        return out
+
+
+class StubJudge:
+    """Stand-in for `OllamaIntegration` returning a deterministic verdict."""
+
+    def __init__(self, latency_ms: float = 0.0) -> None:
+        """Initialize the judge.
+
+        Args:
+            latency_ms (float): Simulated generation time, default=0.
+        """
+        self.latency_ms = latency_ms
+
+    def generate(self, prompt: str, **_: Any) -> str:
+        """Return `Score: N` with N derived from the prompt.
+
+        Args:
+            prompt (str): Rendered judge prompt.
+
+        Returns:
+            str: Verdict text.
+        """
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+        return f"Score: {zlib.crc32(prompt.encode()) % 5 + 1}"
+
+    def close(self) -> None:
+        """Nothing to release."""
+
+
+def install_stubs(judge_latency_ms: float = 0.0, real_model: bool = False) -> None:
+    """Replace the process-wide judge client and, optionally, embedding model.
+
+    Args:
+        judge_latency_ms (float): Simulated judge latency, default=0.
+        real_model (bool): Keep the configured sentence-transformers model
+            instead of the stub embedder, default=False.
+    """
+    from app.config import config
+    from app.domain.retrieval.utils import embeddings_utils
+    from app.integrations.ollama import ollama_integration
+
+    ollama_integration._client = StubJudge(judge_latency_ms)
+    if not real_model:
+        embeddings_utils._model = StubEmbeddingModel(config.retrieval.embeddings.dim)
@@ -0,0 +1,170 @@
+"""Module documentation for `benchmarks/vector_bench.py`.
+
+This module is part of an enterprise-grade, research-ready codebase.
+Docstrings follow the Google Python style guide for consistency and clarity.
+
+Generated on 2025-08-16.
+
+Memory, accuracy and kernel speed of the compact vector representations::
+
+    python -m benchmarks.vector_bench --docs 20000 --queries 200 \\
+        --dtypes float32,float16,int8 --dims 384,256,128
+
+Documents and queries are embedded once (stub embedder unless
+`--real-model`), then every dtype/dim combination is compared against the
+full float32 vectors: bytes per vector and compression ratio, cosine drift of
+the reconstructed vectors, absolute query-document score error, recall@k of
+the exact top-k, and scoring throughput of `CompactVectors.dot`. Truncated
+dims are only meaningful for Matryoshka-trained models; on the stub they
+behave like a random projection.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import time
+from typing import Any, Dict, List
+
+import numpy as np
+
+from benchmarks.eval_bench import Corpus
+from benchmarks.stubs import configure_offline_env, install_stubs
+
+
+def _embed(texts: List[str]) -> np.ndarray:
+    from app.domain.retrieval.utils.embeddings_utils import get_embedding_model
+
+    return np.asarray(get_embedding_model().encode(texts, batch_size=64), np.float32)
+
+
+def run(
+    dtypes: List[str],
+    dims: List[int],
+    docs: int = 20000,
+    queries: int = 200,
+    k: int = 10,
+    real_model: bool = False,
+    seed: int = 0,
+) -> Dict[str, Any]:
+    """Measure each representation against exact float32 scoring.
+
+    Args:
+        dtypes (List[str]): Representations to measure.
+        dims (List[int]): Dimensions to truncate to; the model's full
+            dimension is always included.
+        docs (int): Corpus size, default=20000.
+        queries (int): Number of queries, default=200.
+        k (int): Recall cutoff, default=10.
+        real_model (bool): Use the configured embedding model, default=False.
+        seed (int): Corpus seed, default=0.
+
+    Returns:
+        Dict[str, Any]: `{"docs", "queries", "k", "full_dim", "cases": [...]}`.
+    """
+    configure_offline_env()
+    install_stubs(real_model=real_model)
+    from app.domain.retrieval.utils.vector_utils import (
+        CompactVectors,
+        bytes_per_vector,
+        cosine_drift,
+        normalize_rows,
+        truncate_dim,
+    )
+
+    corpus = Corpus(seed)
+    doc_texts = [corpus.text(80) for _ in range(docs)]
+    query_texts = [
+        corpus.text(12, [doc_texts[i]]) for i in range(0, docs, max(1, docs // queries))
+    ][:queries]
+    doc_full = _embed(doc_texts)
+    query_full = _embed(query_texts)
+    full_dim = doc_full.shape[1]
+    reference = normalize_rows(doc_full)
+    ref_scores = normalize_rows(query_full) @ reference.T
+    ref_top = np.argsort(-ref_scores, axis=1)[:, :k]
+
+    cases: List[Dict[str, Any]] = []
+    for dim in sorted({full_dim, *(d for d in dims if d < full_dim)}, reverse=True):
+        doc_vectors = normalize_rows(truncate_dim(doc_full, dim))
+        query_vectors = normalize_rows(truncate_dim(query_full, dim))
+        for dtype in dtypes:
+            compact = CompactVectors.from_float(doc_vectors, dtype)
+            started = time.perf_counter()
+            scores = np.stack([compact.dot(q) for q in query_vectors])
+            elapsed = time.perf_counter() - started
+            top = np.argpartition(-scores, k, axis=1)[:, :k]
+            recall = np.mean([len(set(t) & set(r)) / k for t, r in zip(top, ref_top)])
+            case = {
+                "dtype": dtype,
+                "dim": dim,
+                "bytes_per_vector": bytes_per_vector(dim, dtype),
+                "compression": round(
+                    bytes_per_vector(full_dim, "float32")
+                    / bytes_per_vector(dim, dtype),
+                    2,
+                ),
+                "corpus_mb": round(compact.nbytes / 2**20, 2),
+                "drift": (
+                    cosine_drift(doc_vectors, compact.to_float())
+                    if dim == full_dim
+                    else {}
+                ),
+                "score_abs_err_mean": round(
+                    float(np.abs(scores - ref_scores).mean()), 6
+                ),
+                "score_abs_err_max": round(float(np.abs(scores - ref_scores).max()), 6),
+                f"recall@{k}": round(float(recall), 4),
+                "scored_vectors_per_s": round(len(query_vectors) * docs / elapsed),
+            }
+            cases.append(case)
+            print(json.dumps(case), flush=True)
+    return {
+        "docs": docs,
+        "queries": len(query_texts),
+        "k": k,
+        "full_dim": full_dim,
+        "embedding": "real" if real_model else "stub",
+        "cases": cases,
+    }
+
+
+def main(argv: List[str] | None = None) -> int:
+    """CLI entry point.
+
+    Args:
+        argv (List[str] | None): Arguments, default=None for `sys.argv`.
+
+    Returns:
+        int: 0.
+    """
+    parser = argparse.ArgumentParser(prog="python -m benchmarks.vector_bench")
+    parser.add_argument("--dtypes", default="float32,float16,int8")
+    parser.add_argument("--dims", default="256,128")
+    parser.add_argument("--docs", type=int, default=20000)
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("-k", type=int, default=10)
+    parser.add_argument(
+        "--real-model",
+        action="store_true",
+        help="use the configured embedding model",
+    )
+    parser.add_argument("-o", "--output", help="write results as JSON")
+    args = parser.parse_args(argv)
+    result = run(
+        [d.strip() for d in args.dtypes.split(",") if d.strip()],
+        [int(d) for d in args.dims.split(",") if d.strip()],
+        docs=args.docs,
+        queries=args.queries,
+        k=args.k,
+        real_model=args.real_model,
+    )
+    if args.output:
+        with open(args.output, "w") as fh:
+            json.dump(result, fh, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
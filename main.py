@@ -1,12 +1,39 @@
+import asyncio
+import threading
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 
 from api.routes.eval_router import router 
+from api.routes.health_router import router as health_router
+from api.routes.metrics_router import router as metrics_router
+from app.constants.values import WARMUP_ENABLED
+from app.services.warmup_service import get_warmup_state, warm_up
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm the worker in the background; `/health/ready` gates traffic."""
+    task = None
+    stop = threading.Event()
+    if WARMUP_ENABLED:
+        task = asyncio.create_task(asyncio.to_thread(warm_up, stop=stop))
+    else:
+        get_warmup_state().finish(True)
+    yield
+    stop.set()
+    if task is not None and not task.done():
+        task.cancel()
+
 
 app = FastAPI(
     title="Evaluation Service",
     description="The evaluation service module",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 
 app.include_router(router)
+app.include_router(metrics_router)
+app.include_router(health_router)